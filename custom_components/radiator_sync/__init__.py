@@ -3,6 +3,7 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, CONF_ROOMS
 from .coordinator import RadiatorSyncCoordinator
+from .services import async_setup_services, async_unload_services
 
 import logging
 
@@ -28,13 +29,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await coordinator.async_start()
+    async_setup_services(hass)
     entry.async_on_unload(entry.add_update_listener(update_listener))
     return True
 
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply options update in place, restarting only affected rooms."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    data["options"] = dict(entry.options)
+    await data["coordinator"].async_update_options(entry.options)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -42,6 +47,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok:
         if DOMAIN in hass.data:
-            hass.data[DOMAIN].pop(entry.entry_id, None)
+            data = hass.data[DOMAIN].pop(entry.entry_id, None)
+            if data:
+                await data["coordinator"].async_shutdown()
+        async_unload_services(hass)
 
     return unload_ok
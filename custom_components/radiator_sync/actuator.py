@@ -0,0 +1,161 @@
+from datetime import datetime
+from time import monotonic
+from typing import Any, Callable, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DEFAULT_MAX_COMMANDS_PER_SECOND
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# Commands queued within this window can share one service call
+COMMAND_BATCH_WINDOW = 0.05
+
+# Dispatch order, lowest first
+PRIORITY_HEATER = 0
+PRIORITY_FAR_BELOW_TARGET = 1
+PRIORITY_NEAR_TARGET = 2
+
+# Room heat demand (%) from which a room counts as far below target
+FAR_BELOW_TARGET_DEMAND = 50
+
+
+class ActuatorQueue:
+    """Rate-limited, prioritized queue for heater and thermostat commands.
+
+    Every command is keyed by its target entity, so a newer command replaces
+    a queued one. Commands are sent in priority order while the token bucket
+    allows, one token per commanded entity; queued commands with the same
+    service and data are grouped into one multi-entity service call. A
+    command's on_sent callback runs when it is actually sent, and never for
+    a command that was replaced or dropped.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: float = DEFAULT_MAX_COMMANDS_PER_SECOND,
+        on_dispatch: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.hass = hass
+        self.rate = rate
+        self._on_dispatch = on_dispatch
+
+        # entity_id -> (priority, domain, service, data, enqueued at, on_sent)
+        self._queue: dict[
+            str,
+            tuple[int, str, str, dict[str, Any], float, Optional[Callable[[], None]]],
+        ] = {}
+        # Starts full; clamped to the burst size by the first refill
+        self._tokens = float("inf")
+        self._refilled = monotonic()
+        self._unsub_dispatch: Optional[Callable] = None
+
+        self.commands_sent = 0
+        self.commands_dropped = 0
+        self.service_calls = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of entities with a queued command."""
+        return len(self._queue)
+
+    @callback
+    def async_enqueue(
+        self,
+        domain: str,
+        service: str,
+        entity_id: str,
+        data: dict[str, Any],
+        priority: int,
+        on_sent: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Queue a command for entity_id, replacing any queued one."""
+        if entity_id in self._queue:
+            self.commands_dropped += 1
+        self._queue[entity_id] = (
+            priority,
+            domain,
+            service,
+            data,
+            monotonic(),
+            on_sent,
+        )
+
+        if priority == PRIORITY_HEATER:
+            # Do not hold the heater back for the batching window
+            self.hass.async_create_task(self._async_dispatch())
+        elif self._unsub_dispatch is None:
+            self._unsub_dispatch = async_call_later(
+                self.hass, COMMAND_BATCH_WINDOW, self._async_dispatch
+            )
+
+    async def async_flush(self) -> None:
+        """Send what the rate limit allows now and drop the rest.
+
+        Used on unload. Rooms re-run climate control when the entry starts
+        again, so setpoints still waiting for a token would be stale by then.
+        """
+        await self._async_dispatch()
+        if self._unsub_dispatch is not None:
+            self._unsub_dispatch()
+            self._unsub_dispatch = None
+        if self._queue:
+            _LOGGER.debug("Dropping %s rate limited commands", self.depth)
+            self.commands_dropped += self.depth
+            self._queue.clear()
+
+    def _refill(self) -> None:
+        now = monotonic()
+        burst = max(1.0, self.rate)
+        self._tokens = min(burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    async def _async_call(
+        self, domain: str, service: str, data: dict[str, Any]
+    ) -> None:
+        await self.hass.services.async_call(domain, service, data, blocking=False)
+
+    async def _async_dispatch(self, _now: Optional[datetime] = None) -> None:
+        if self._unsub_dispatch is not None:
+            self._unsub_dispatch()
+            self._unsub_dispatch = None
+
+        self._refill()
+        while self._queue and self._tokens >= 1:
+            head = min(self._queue, key=lambda entity_id: self._queue[entity_id][0])
+            _, domain, service, data, _, _ = self._queue[head]
+            group = [head] + [
+                entity_id
+                for entity_id, command in self._queue.items()
+                if entity_id != head and command[1:4] == (domain, service, data)
+            ]
+            group = group[: int(min(self._tokens, len(group)))]
+
+            now = monotonic()
+            for entity_id in group:
+                *_, enqueued, on_sent = self._queue.pop(entity_id)
+                wait = now - enqueued
+                self.last_wait = wait
+                self.max_wait = max(self.max_wait, wait)
+                if on_sent is not None:
+                    on_sent()
+            self._tokens -= len(group)
+            self.commands_sent += len(group)
+            self.service_calls += 1
+
+            await self._async_call(domain, service, {"entity_id": group, **data})
+
+        if self._queue and self._unsub_dispatch is None:
+            _LOGGER.debug("Command budget exhausted, %s commands queued", self.depth)
+            self._unsub_dispatch = async_call_later(
+                self.hass, (1 - self._tokens) / self.rate, self._async_dispatch
+            )
+
+        if self._on_dispatch is not None:
+            self._on_dispatch()
@@ -1,9 +1,11 @@
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_ROOM_ADDED
 from .radiator.entities import RadiatorSyncRoomClimate
+from .radiator.state_manager import RadiatorStateManager
 from .coordinator import RadiatorSyncCoordinator
 
 
@@ -20,3 +22,13 @@ async def async_setup_entry(
 
     entities = [RadiatorSyncRoomClimate(room) for room in coordinator.get_rooms()]
     async_add_entities(entities)
+
+    @callback
+    def _room_added(room: RadiatorStateManager):
+        async_add_entities([RadiatorSyncRoomClimate(room)])
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ROOM_ADDED.format(entry.entry_id), _room_added
+        )
+    )
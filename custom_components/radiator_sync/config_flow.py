@@ -16,8 +16,24 @@ from .const import (
     CONF_SENSOR_HUM,
     CONF_HYSTERESIS,
     DEFAULT_HYSTERESIS,
+    CONF_DEADBAND,
     CONF_PRESETS,
     DEFAULT_PRESETS,
+    CONF_ADVANCED,
+    CONF_COALESCE_WINDOW,
+    CONF_SAVE_DELAY,
+    CONF_MAX_WRITES_PER_HOUR,
+    CONF_MAX_COMMANDS_PER_SECOND,
+    CONF_LATENCY_TIMINGS,
+    CONF_LOOP_BUDGET,
+    CONF_LOOP_BUDGET_STRICT,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_MAX_WRITES_PER_HOUR,
+    DEFAULT_MAX_COMMANDS_PER_SECOND,
+    DEFAULT_LATENCY_TIMINGS,
+    DEFAULT_LOOP_BUDGET,
+    DEFAULT_LOOP_BUDGET_STRICT,
     CONF_MIN_ON,
     CONF_MIN_OFF,
     DEFAULT_MIN_ON,
@@ -76,6 +92,7 @@ class RadiatorSyncOptionsFlow(config_entries.OptionsFlow):
             else:
                 self.presets[name] = val
 
+        self.advanced: Dict[str, Any] = dict(entry.options.get(CONF_ADVANCED, {}))
         self.room_name: str | None = None
 
     async def async_step_init(self, user_input=None):
@@ -90,6 +107,8 @@ class RadiatorSyncOptionsFlow(config_entries.OptionsFlow):
                 return await self.async_step_remove_room()
             if action == "manage_presets":
                 return await self.async_step_manage_presets()
+            if action == "advanced":
+                return await self.async_step_advanced()
 
         schema = vol.Schema(
             {
@@ -100,6 +119,7 @@ class RadiatorSyncOptionsFlow(config_entries.OptionsFlow):
                             {"value": "edit_room", "label": "edit_room"},
                             {"value": "remove_room", "label": "remove_room"},
                             {"value": "manage_presets", "label": "manage_presets"},
+                            {"value": "advanced", "label": "advanced"},
                         ],
                         translation_key="operation",
                     )
@@ -125,6 +145,9 @@ class RadiatorSyncOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional(CONF_HYSTERESIS, default=DEFAULT_HYSTERESIS): vol.Coerce(  # type: ignore
                     float
                 ),
+                vol.Optional(CONF_DEADBAND): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=2)
+                ),
             }
         )
 
@@ -193,6 +216,10 @@ class RadiatorSyncOptionsFlow(config_entries.OptionsFlow):
                     CONF_HYSTERESIS,
                     default=_get_default(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
                 ): vol.Coerce(float),
+                vol.Optional(
+                    CONF_DEADBAND,
+                    description={"suggested_value": room.get(CONF_DEADBAND)},
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=2)),
             }
         )
 
@@ -232,10 +259,66 @@ class RadiatorSyncOptionsFlow(config_entries.OptionsFlow):
         )
         return self.async_show_form(step_id="remove_room", data_schema=schema)
 
+    # ---------- ADVANCED ----------
+    async def async_step_advanced(self, user_input=None):
+        """Tune coordinator behaviour."""
+        if user_input is not None:
+            self.advanced.update(user_input)
+            return await self._save_and_restart_options()
+
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_COALESCE_WINDOW,
+                    default=self.advanced.get(
+                        CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10000)),
+                vol.Optional(
+                    CONF_SAVE_DELAY,
+                    default=self.advanced.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(
+                    CONF_MAX_WRITES_PER_HOUR,
+                    default=self.advanced.get(
+                        CONF_MAX_WRITES_PER_HOUR, DEFAULT_MAX_WRITES_PER_HOUR
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                vol.Optional(
+                    CONF_MAX_COMMANDS_PER_SECOND,
+                    default=self.advanced.get(
+                        CONF_MAX_COMMANDS_PER_SECOND, DEFAULT_MAX_COMMANDS_PER_SECOND
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=100)),
+                vol.Optional(
+                    CONF_LATENCY_TIMINGS,
+                    default=self.advanced.get(
+                        CONF_LATENCY_TIMINGS, DEFAULT_LATENCY_TIMINGS
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_LOOP_BUDGET,
+                    default=self.advanced.get(CONF_LOOP_BUDGET, DEFAULT_LOOP_BUDGET),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10000)),
+                vol.Optional(
+                    CONF_LOOP_BUDGET_STRICT,
+                    default=self.advanced.get(
+                        CONF_LOOP_BUDGET_STRICT, DEFAULT_LOOP_BUDGET_STRICT
+                    ),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="advanced", data_schema=schema)
+
     # ---------- WRITE OPTIONS ----------
     async def _save_and_restart_options(self):
         return self.async_create_entry(
-            title="", data={CONF_ROOMS: self.rooms, CONF_PRESETS: self.presets}
+            title="",
+            data={
+                CONF_ROOMS: self.rooms,
+                CONF_PRESETS: self.presets,
+                CONF_ADVANCED: self.advanced,
+            },
         )
 
     # ---------- MANAGE PRESETS ----------
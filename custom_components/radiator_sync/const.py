@@ -1,5 +1,27 @@
 DOMAIN = "radiator_sync"
 
+# Update key for entities aggregating presets over all rooms
+GLOBAL_PRESET = "global_preset"
+
+# Update key for entities showing runtime state writes
+RUNTIME_STATE = "runtime_state"
+
+# Update key for entities showing the actuator command queue
+ACTUATOR_QUEUE = "actuator_queue"
+
+# Update key for entities showing hot-path latency timings
+LATENCY_TIMINGS = "latency_timings"
+LOOP_BUDGET = "loop_budget"
+
+# Dispatcher signal for rooms added by an options update, formatted with entry id
+SIGNAL_ROOM_ADDED = f"{DOMAIN}_room_added_{{}}"
+
+# Roles of tracked entities in the shared state-change dispatcher
+ROLE_TEMP = "temp"
+ROLE_HUMIDITY = "humidity"
+ROLE_TRV = "trv"
+ROLE_HEATER = "heater"
+
 # Device + heater
 CONF_HEATER = "heater"
 CONF_MIN_ON = "min_on_s"
@@ -12,11 +34,30 @@ CONF_ROOM_CLIMATE = "climate_entity"
 CONF_SENSOR_TEMP = "temperature_sensor"
 CONF_SENSOR_HUM = "humidity_sensor"
 CONF_HYSTERESIS = "hysteresis"
+CONF_DEADBAND = "deadband"
 CONF_PRESETS = "presets"
 
+# Advanced tuning
+CONF_ADVANCED = "advanced"
+CONF_COALESCE_WINDOW = "coalesce_window_ms"
+CONF_SAVE_DELAY = "save_delay_s"
+CONF_MAX_WRITES_PER_HOUR = "max_writes_per_hour"
+CONF_MAX_COMMANDS_PER_SECOND = "max_commands_per_second"
+CONF_LATENCY_TIMINGS = "latency_timings"
+CONF_LOOP_BUDGET = "loop_budget_ms"
+CONF_LOOP_BUDGET_STRICT = "loop_budget_strict"
+
 # Defaults
 DEFAULT_HYSTERESIS = 0.3
+DEFAULT_DEADBAND = 0.0
 DEFAULT_MIN_ON = 8 * 60
 DEFAULT_MIN_OFF = 5 * 60
+DEFAULT_COALESCE_WINDOW = 250
+DEFAULT_SAVE_DELAY = 60
+DEFAULT_MAX_WRITES_PER_HOUR = 30
+DEFAULT_MAX_COMMANDS_PER_SECOND = 5
+DEFAULT_LATENCY_TIMINGS = False
+DEFAULT_LOOP_BUDGET = 50
+DEFAULT_LOOP_BUDGET_STRICT = False
 
 DEFAULT_PRESETS = {}
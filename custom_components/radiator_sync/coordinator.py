@@ -1,21 +1,79 @@
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping, Optional
+import asyncio
+from datetime import datetime, timedelta
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 
 from .heater.state_manager import HeaterStateManager
 from .radiator.state_manager import RadiatorStateManager
-from .const import DOMAIN
+from .persistence import RuntimeStatePersistence
+from .actuator import ActuatorQueue
+from .decision_trace import DecisionTrace
+from .watchdog import (
+    LoopBudgetWatchdog,
+    STAGE_CLIMATE_CONTROL,
+    DEGRADED_COALESCE_FACTOR,
+    DEGRADED_MIN_COALESCE_WINDOW,
+)
+from .timing import (
+    StageTimings,
+    STAGE_TEMP_UPDATE,
+    STAGE_ORCHESTRATE,
+    STAGE_APPLY_HEAT_DEMAND,
+    STAGE_PERSIST,
+    STAGE_LISTENER_FANOUT,
+    STAGE_SERVICE_CALL,
+)
+from .const import (
+    DOMAIN,
+    GLOBAL_PRESET,
+    RUNTIME_STATE,
+    ACTUATOR_QUEUE,
+    LATENCY_TIMINGS,
+    LOOP_BUDGET,
+    SIGNAL_ROOM_ADDED,
+    CONF_ROOMS,
+    CONF_PRESETS,
+    CONF_ADVANCED,
+    CONF_COALESCE_WINDOW,
+    CONF_SAVE_DELAY,
+    CONF_MAX_WRITES_PER_HOUR,
+    CONF_MAX_COMMANDS_PER_SECOND,
+    CONF_LATENCY_TIMINGS,
+    CONF_LOOP_BUDGET,
+    CONF_LOOP_BUDGET_STRICT,
+    DEFAULT_PRESETS,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_MAX_WRITES_PER_HOUR,
+    DEFAULT_MAX_COMMANDS_PER_SECOND,
+    DEFAULT_LATENCY_TIMINGS,
+    DEFAULT_LOOP_BUDGET,
+    DEFAULT_LOOP_BUDGET_STRICT,
+)
 
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
-STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}.runtime_state"
 
+# How often latency timing sensors are refreshed
+TIMINGS_PUBLISH_INTERVAL = timedelta(minutes=1)
+
+# Full recompute of the aggregate heat demand as a consistency check
+DEMAND_RECOMPUTE_INTERVAL = timedelta(minutes=15)
+
 
 class RadiatorSyncCoordinator(DataUpdateCoordinator[None]):
     """DataUpdateCoordinator for Radiator Sync."""
@@ -36,61 +94,592 @@ class RadiatorSyncCoordinator(DataUpdateCoordinator[None]):
         )
 
         self.entry = entry
-        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}")
-        self._runtime_state: dict[str, Any] = {}
+        self.persistence = RuntimeStatePersistence(
+            hass, f"{STORAGE_KEY}_{entry.entry_id}", on_write=self._async_state_written
+        )
+        self.actuators = ActuatorQueue(hass, on_dispatch=self._async_actuators_sent)
+        self.trace = DecisionTrace()
+        self.watchdog = LoopBudgetWatchdog(
+            DEFAULT_LOOP_BUDGET / 1000.0, on_violation=self._async_budget_exceeded
+        )
+        advanced = entry.options.get(CONF_ADVANCED, {})
+        self._apply_advanced(advanced)
+
+        # Latency timings are opt-in; when off, nothing is instrumented
+        self.timings: Optional[StageTimings] = None
+        if advanced.get(CONF_LATENCY_TIMINGS, DEFAULT_LATENCY_TIMINGS):
+            self.timings = StageTimings()
+        self._unsub_timings: Optional[Callable] = None
+
+        # Coalescing of room events into one orchestration pass per window
+        self._dirty_rooms: set[RadiatorStateManager] = set()
+        self._display_rooms: set[RadiatorStateManager] = set()
+        self._unsub_scheduled: Optional[Callable] = None
+        self.orchestration_count = 0
+
+        # Running aggregate of room heat demands, updated by per-room deltas
+        self._room_demands: dict[RadiatorStateManager, int] = {}
+        self._stale_demands: set[RadiatorStateManager] = set()
+        self._total_heat_demand = 0
+        self._unsub_recompute: Optional[Callable] = None
+
+        # Keys (state managers or GLOBAL_PRESET) whose listeners need an update
+        self._published: set[object] = set()
+        self.entities: set[Entity] = set()
+
+        # Rooms started before the startup pass, handled in one batch
+        self._started = False
+        self._starting_rooms: list[RadiatorStateManager] = []
+
+        # Single-flight orchestration
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._queued_refresh: Optional[asyncio.Future[None]] = None
+
+        # One state-change subscription over all tracked entities, dispatched
+        # through entity_id -> (role, manager) -> handler
+        self._state_handlers: dict[
+            str, dict[tuple[str, object], Callable[[Optional[State]], None]]
+        ] = {}
+        self._unsub_state_changes: Optional[Callable] = None
+        self._resubscribe_pending = False
 
         self.heater = HeaterStateManager(self, heater_conf)
+        self._set_presets(entry.options.get(CONF_PRESETS, DEFAULT_PRESETS))
         self.rooms: dict[str, RadiatorStateManager] = {}
+        self._rooms_conf: dict[str, Mapping[str, Any]] = {}
+        self._storage_keys: dict[HeaterStateManager | RadiatorStateManager, str] = {
+            self.heater: "heater"
+        }
 
         for name, config in rooms_conf.items():
-            room = RadiatorStateManager(self, config)
-            self.rooms[name] = room
+            self._add_room(name, config)
+
+        if self.timings is not None:
+            self.timings.instrument(self, "_orchestrate", STAGE_ORCHESTRATE)
+            self.timings.instrument(self.persistence, "_serialize", STAGE_PERSIST)
+            self.timings.instrument(
+                self, "async_update_published_listeners", STAGE_LISTENER_FANOUT
+            )
+            self.timings.instrument(
+                self.heater, "apply_heat_demand", STAGE_APPLY_HEAT_DEMAND
+            )
+            self.timings.instrument(self.actuators, "_async_call", STAGE_SERVICE_CALL)
+
+    def _apply_advanced(self, advanced: Mapping[str, Any]) -> None:
+        self.watchdog.budget = (
+            advanced.get(CONF_LOOP_BUDGET, DEFAULT_LOOP_BUDGET) / 1000.0
+        )
+        self.watchdog.strict = advanced.get(
+            CONF_LOOP_BUDGET_STRICT, DEFAULT_LOOP_BUDGET_STRICT
+        )
+        if not self.watchdog.strict:
+            self.watchdog.degraded = False
+        self._configured_coalesce_window = (
+            advanced.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW) / 1000.0
+        )
+        self._update_coalesce_window()
+        self.persistence.save_delay = advanced.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)
+        self.persistence.max_writes_per_hour = advanced.get(
+            CONF_MAX_WRITES_PER_HOUR, DEFAULT_MAX_WRITES_PER_HOUR
+        )
+        self.actuators.rate = advanced.get(
+            CONF_MAX_COMMANDS_PER_SECOND, DEFAULT_MAX_COMMANDS_PER_SECOND
+        )
+
+    def _update_coalesce_window(self) -> None:
+        self.coalesce_window = self._configured_coalesce_window
+        if self.watchdog.degraded:
+            self.coalesce_window = max(
+                self.coalesce_window * DEGRADED_COALESCE_FACTOR,
+                DEGRADED_MIN_COALESCE_WINDOW,
+            )
+
+    @callback
+    def _async_budget_exceeded(self) -> None:
+        self._update_coalesce_window()
+        self.async_publish(LOOP_BUDGET)
+        self.async_update_published_listeners()
+
+    def _set_presets(self, presets: Mapping[str, Any]) -> None:
+        # Replaced, never mutated, so entities can compare by identity
+        self.presets_conf = presets
+        self.preset_names = list(presets)
+
+    def _add_room(self, name: str, config: Mapping[str, Any]) -> RadiatorStateManager:
+        room = RadiatorStateManager(self, config)
+        self.rooms[name] = room
+        self._rooms_conf[name] = config
+        self._storage_keys[room] = f"room_{name}"
+        if self.timings is not None:
+            self.timings.instrument(room, "_temp_update", STAGE_TEMP_UPDATE)
+        return room
 
     async def async_setup(self):
         """Set up the coordinator and load runtime state."""
-        data = await self._store.async_load()
-        if data:
-            self._runtime_state = data
+        runtime_state = await self.persistence.async_load()
 
         # Initialize state managers with loaded state
-        self.heater.load_state(self._runtime_state.get("heater", {}))
+        self.heater.load_state(runtime_state.get("heater", {}))
         for name, room in self.rooms.items():
-            room.load_state(self._runtime_state.get(f"room_{name}", {}))
+            room.load_state(runtime_state.get(f"room_{name}", {}))
 
-    async def async_save_runtime_state(self):
-        """Save runtime state to store."""
-        state = {
-            "heater": self.heater.get_state(),
-        }
-        for name, room in self.rooms.items():
-            state[f"room_{name}"] = room.get_state()
+        self._unsub_recompute = async_track_time_interval(
+            self.hass, self._async_recompute_heat_demand, DEMAND_RECOMPUTE_INTERVAL
+        )
+        if self.timings is not None:
+            self._unsub_timings = async_track_time_interval(
+                self.hass, self._async_publish_timings, TIMINGS_PUBLISH_INTERVAL
+            )
+
+    @callback
+    def _async_publish_timings(self, _now: datetime) -> None:
+        # Histograms change on every event; sensors only follow periodically
+        self.async_publish(LATENCY_TIMINGS)
+        self.async_update_published_listeners()
+
+    @callback
+    def async_room_started(self, room: RadiatorStateManager) -> None:
+        """Take a room whose tracking just started into account."""
+        if not self._started:
+            self._starting_rooms.append(room)
+            return
+        room.read_initial_state()
+        self.async_schedule_update(room)
+
+    async def async_start(self) -> None:
+        """Finish startup once all platforms have added their entities.
+
+        Rooms started so far are read in one batch and orchestrated in a
+        single pass, after which their thermostat commands are queued. The
+        heater always gets a decision, even if its restored demand is
+        unchanged.
+        """
+        self._started = True
+        rooms = self._starting_rooms
+        self._starting_rooms = []
+        for room in rooms:
+            room.read_initial_state()
+            self.async_publish(room)
+
+        await self.async_refresh_entities()
+        await self._async_apply_climate_control(rooms)
+        # Restored demand equal to the computed one skips apply_heat_demand
+        await self.heater.async_evaluate()
+
+    async def async_update_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed options in place instead of reloading the entry.
+
+        Only rooms whose configuration changed are touched: removed rooms
+        are stopped and their entities removed, edited rooms restart their
+        tracking, and added rooms are announced to the platforms. All other
+        rooms keep their subscriptions and in-memory state.
+        """
+        advanced = options.get(CONF_ADVANCED, {})
+        if advanced.get(CONF_LATENCY_TIMINGS, DEFAULT_LATENCY_TIMINGS) != (
+            self.timings is not None
+        ):
+            # Instrumentation is set up once; toggling it needs a fresh start
+            self.hass.config_entries.async_schedule_reload(self.entry.entry_id)
+            return
+        self._apply_advanced(advanced)
+
+        rooms_conf = options.get(CONF_ROOMS, {})
+        for name in [name for name in self.rooms if name not in rooms_conf]:
+            await self._async_remove_room(name)
+
+        for name, config in rooms_conf.items():
+            if name not in self.rooms:
+                continue
+            if config == self._rooms_conf[name]:
+                continue
+            _LOGGER.debug("Room '%s' changed, restarting tracking", name)
+            room = self.rooms[name]
+            self._rooms_conf[name] = config
+            await room.stop()
+            room.update_config(config)
+            await room.start()
+
+        runtime_state = self.persistence.state
+        for name, config in rooms_conf.items():
+            if name in self.rooms:
+                continue
+            room = self._add_room(name, config)
+            room.load_state(runtime_state.get(f"room_{name}", {}))
+            async_dispatcher_send(
+                self.hass, SIGNAL_ROOM_ADDED.format(self.entry.entry_id), room
+            )
+
+        # Rooms compile their preset tables lazily from the new options
+        presets = options.get(CONF_PRESETS, DEFAULT_PRESETS)
+        if presets != self.presets_conf:
+            self._set_presets(presets)
+            for room in self.rooms.values():
+                room.invalidate_presets()
+                self.async_publish(room)
+            self.async_publish(GLOBAL_PRESET)
+
+        await self.async_refresh_entities()
+
+    async def _async_remove_room(self, name: str) -> None:
+        _LOGGER.debug("Room '%s' removed", name)
+        room = self.rooms.pop(name)
+        self._rooms_conf.pop(name)
+        await room.stop()
+
+        entity_registry = er.async_get(self.hass)
+        for entity in [
+            entity
+            for entity in self.entities
+            if getattr(entity, "radiator_state", None) is room
+        ]:
+            if entity.registry_entry is not None:
+                entity_registry.async_remove(entity.entity_id)
+            else:
+                await entity.async_remove()
+
+        # Drop the room from the aggregate and from any pending work
+        self._total_heat_demand -= self._room_demands.pop(room, 0)
+        self._stale_demands.discard(room)
+        self._dirty_rooms.discard(room)
+        self._display_rooms.discard(room)
+        self.persistence.async_remove(self._storage_keys.pop(room))
+
+    @callback
+    def async_save_runtime_state(
+        self, manager: HeaterStateManager | RadiatorStateManager
+    ) -> None:
+        """Mark a state manager dirty; it is written out by the next delayed save."""
+        self.persistence.async_mark_dirty(
+            self._storage_keys[manager], manager.get_state
+        )
+
+    @property
+    def total_heat_demand(self) -> int:
+        """Return the aggregate heat demand as of the last orchestration."""
+        return self._total_heat_demand
+
+    @property
+    def listener_count(self) -> int:
+        """Return the number of registered coordinator listeners."""
+        return len(self._listeners)
+
+    @property
+    def tracked_entity_count(self) -> int:
+        """Return the number of entities in the shared state subscription."""
+        return len(self._state_handlers)
 
-        self._runtime_state = state
-        await self._store.async_save(state)
+    @property
+    def subscription_count(self) -> int:
+        """Return the number of (entity, role) handlers registered."""
+        return sum(len(handlers) for handlers in self._state_handlers.values())
+
+    @property
+    def mailbox_backlog(self) -> int:
+        """Return the number of room samples waiting for the next pass."""
+        return sum(
+            room.mailbox_depth for room in self._dirty_rooms | self._display_rooms
+        )
+
+    @property
+    def events_conflated(self) -> int:
+        """Return how many samples were replaced before being applied."""
+        return sum(room.events_conflated for room in self.rooms.values())
+
+    @property
+    def filter_hit_rate(self) -> float:
+        """Return the share of temperature events dropped by room deadbands."""
+        events = sum(room.temp_events for room in self.rooms.values())
+        if not events:
+            return 0.0
+        filtered = sum(room.temp_events_filtered for room in self.rooms.values())
+        return filtered / events
+
+    @callback
+    def async_track_entity(
+        self,
+        entity_id: str,
+        role: str,
+        owner: object,
+        handler: Callable[[Optional[State]], None],
+    ) -> CALLBACK_TYPE:
+        """Route state changes of entity_id to handler; return a remover."""
+        handlers = self._state_handlers.setdefault(entity_id, {})
+        handlers[(role, owner)] = handler
+        if len(handlers) == 1:
+            self._async_schedule_resubscribe()
+
+        @callback
+        def _remove() -> None:
+            handlers = self._state_handlers.get(entity_id)
+            if handlers is None or handlers.pop((role, owner), None) is None:
+                return
+            if not handlers:
+                del self._state_handlers[entity_id]
+                self._async_schedule_resubscribe()
+
+        return _remove
+
+    @callback
+    def _async_schedule_resubscribe(self) -> None:
+        # Rooms start one after another; rebuild the subscription once per batch
+        if not self._resubscribe_pending:
+            self._resubscribe_pending = True
+            self.hass.loop.call_soon(self._async_resubscribe)
+
+    @callback
+    def _async_resubscribe(self) -> None:
+        self._resubscribe_pending = False
+        if self._unsub_state_changes:
+            self._unsub_state_changes()
+            self._unsub_state_changes = None
+        if self._state_handlers:
+            self._unsub_state_changes = async_track_state_change_event(
+                self.hass, list(self._state_handlers), self._async_state_changed
+            )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        handlers = self._state_handlers.get(event.data["entity_id"])
+        if not handlers:
+            return
+        new_state = event.data.get("new_state")
+        for handler in list(handlers.values()):
+            handler(new_state)
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending orchestration pass and flush runtime state."""
+        await super().async_shutdown()
+        await self.persistence.async_flush()
+        if self._unsub_state_changes:
+            self._unsub_state_changes()
+            self._unsub_state_changes = None
+        if self._unsub_scheduled:
+            self._unsub_scheduled()
+            self._unsub_scheduled = None
+        if self._unsub_recompute:
+            self._unsub_recompute()
+            self._unsub_recompute = None
+        if self._unsub_timings:
+            self._unsub_timings()
+            self._unsub_timings = None
+        await self.actuators.async_flush()
+        self._dirty_rooms.clear()
+        self._display_rooms.clear()
+
+    async def async_set_preset_mode(self, preset_mode: Optional[str]) -> None:
+        """Apply a preset to all rooms as one transaction.
+
+        Rooms are updated in memory first, their thermostat commands are
+        queued, and the result is persisted and orchestrated once. None
+        clears the preset everywhere.
+        """
+        rooms = [room for room in self.rooms.values() if room.apply_preset(preset_mode)]
+        for room in rooms:
+            self.async_save_runtime_state(room)
+            self.async_publish(room)
+
+        await self._async_apply_climate_control(rooms)
+        await self.async_refresh_entities()
+
+    async def _async_apply_climate_control(
+        self, rooms: list[RadiatorStateManager]
+    ) -> None:
+        """Run climate control for rooms.
+
+        Commands only go onto the actuator queue, which paces them, so rooms
+        are simply handled one after another.
+        """
+        chain = self.watchdog.start()
+        for room in rooms:
+            await room._apply_climate_control()
+            chain.lap(STAGE_CLIMATE_CONTROL, room.room_name)
+        chain.finish()
+
+    @callback
+    def async_queue_setpoint(
+        self,
+        entity_id: str,
+        value: float,
+        priority: int,
+        on_sent: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Queue a thermostat setpoint on the actuator queue."""
+        self.actuators.async_enqueue(
+            "climate",
+            "set_temperature",
+            entity_id,
+            {"temperature": value},
+            priority,
+            on_sent,
+        )
+
+    @callback
+    def _async_state_written(self) -> None:
+        self.async_publish(RUNTIME_STATE)
+        self.async_update_published_listeners()
+
+    @callback
+    def _async_actuators_sent(self) -> None:
+        self.async_publish(ACTUATOR_QUEUE)
+        self.async_update_published_listeners()
 
     def get_rooms(self):
         """Return all managed rooms."""
         return self.rooms.values()
 
     async def async_refresh_entities(self):
-        """Notify all managed entities to update their state and run orchestration."""
+        """Run orchestration and update entities of published state managers.
+
+        Passes are single-flight: while one runs, further requests collapse
+        into at most one queued pass, and callers wait until it completes.
+        """
+        if self._refresh_task is not None:
+            if self._queued_refresh is None:
+                self._queued_refresh = self.hass.loop.create_future()
+            if asyncio.current_task() is self._refresh_task:
+                # Re-entrant request from inside the running pass
+                return
+            await asyncio.shield(self._queued_refresh)
+            return
+
+        self._refresh_task = asyncio.current_task()
+        try:
+            await self._async_refresh_pass()
+            while (queued := self._queued_refresh) is not None:
+                self._queued_refresh = None
+                try:
+                    await self._async_refresh_pass()
+                finally:
+                    queued.set_result(None)
+        finally:
+            self._refresh_task = None
+            if (queued := self._queued_refresh) is not None:
+                self._queued_refresh = None
+                queued.set_result(None)
+
+    async def async_refresh_entities_coalesced(self) -> None:
+        """Refresh now, unless a coalesced pass is already armed.
+
+        The armed pass orchestrates and fans out everything published so
+        far, so a request arriving inside the window joins it.
+        """
+        if self._unsub_scheduled is not None:
+            return
+        await self.async_refresh_entities()
+
+    async def _async_refresh_pass(self) -> None:
+        chain = self.watchdog.start()
         await self.on_update()
-        self.async_update_listeners()
+        chain.lap(STAGE_ORCHESTRATE)
+        self.async_update_published_listeners()
+        chain.lap(STAGE_LISTENER_FANOUT)
+        chain.finish()
+
+    @callback
+    def async_publish(self, key: object) -> None:
+        """Queue an update for entities subscribed to key."""
+        self._published.add(key)
+
+    @callback
+    def async_update_published_listeners(self) -> None:
+        """Update listeners whose context was published since the last fan-out.
+
+        Listeners registered without a context are treated as broadcast
+        listeners and are updated on every fan-out.
+        """
+        if not self._published:
+            return
+
+        published = self._published
+        self._published = set()
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in published:
+                update_callback()
+
+    @callback
+    def async_schedule_update(self, room: RadiatorStateManager) -> None:
+        """Mark a room dirty and coalesce work into one pass per window.
+
+        The timer is armed by the first dirty room and is not extended by
+        later events, so the coalescing window is also the upper bound on
+        how long a heater decision can be delayed.
+        """
+        self._dirty_rooms.add(room)
+        self._async_arm_scheduled()
+
+    @callback
+    def async_schedule_display_update(self, room: RadiatorStateManager) -> None:
+        """Queue a display-only refresh of a room's climate entity.
+
+        Display rooms share the coalescing window but never orchestrate the
+        heater or command the thermostat.
+        """
+        self._display_rooms.add(room)
+        self._async_arm_scheduled()
+
+    @callback
+    def _async_arm_scheduled(self) -> None:
+        if self._unsub_scheduled is None:
+            self._unsub_scheduled = async_call_later(
+                self.hass, self.coalesce_window, self._async_run_scheduled
+            )
+
+    async def _async_run_scheduled(self, _now: datetime) -> None:
+        """Apply climate control for dirty rooms and orchestrate once."""
+        self._unsub_scheduled = None
+        dirty_rooms = list(self._dirty_rooms)
+        self._dirty_rooms.clear()
+        for room in dirty_rooms:
+            room.drain_mailbox()
+            self.async_publish(room)
+
+        display_rooms = self._display_rooms
+        self._display_rooms = set()
+        for room in display_rooms:
+            room.drain_mailbox()
+            self.async_publish(room.display_key)
+
+        if not dirty_rooms:
+            self.async_update_published_listeners()
+            return
+
+        await self._async_apply_climate_control(dirty_rooms)
+        await self.async_refresh_entities()
+
+    @callback
+    def mark_demand_stale(self, room: RadiatorStateManager) -> None:
+        """Mark a room whose demand must be folded into the aggregate."""
+        self._stale_demands.add(room)
 
     def _orchestrate(self):
-        """Calculate and return total heat demand."""
-        heat_demands = [
-            demand
-            for room in self.rooms.values()
-            if (demand := room.get_heat_demand()) is not None
-        ]
-
-        if not heat_demands:
-            return 0.0
+        """Apply demand deltas of changed rooms and return total heat demand."""
+        for room in self._stale_demands:
+            demand = room.get_heat_demand()
+            self._total_heat_demand += demand - self._room_demands.get(room, 0)
+            self._room_demands[room] = demand
+        self._stale_demands.clear()
 
-        return sum(heat_demands)
+        return self._total_heat_demand
+
+    async def _async_recompute_heat_demand(self, _now: datetime) -> None:
+        """Rebuild the aggregate from scratch and correct any drift."""
+        total = sum(room.compute_heat_demand() for room in self.rooms.values())
+        if total == self._orchestrate():
+            return
+
+        _LOGGER.warning(
+            "Aggregate heat demand drifted (%s != %s), recomputing",
+            self._total_heat_demand,
+            total,
+        )
+        self._room_demands.clear()
+        self._total_heat_demand = 0
+        for room in self.rooms.values():
+            room.invalidate_heat_demand()
+        await self.async_refresh_entities()
 
     async def on_update(self):
         """Orchestrate heater demand based on room demands."""
+        self.orchestration_count += 1
         heat_demand = self._orchestrate()
         await self.heater.apply_heat_demand(heat_demand)
@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from homeassistant.util import dt as dt_util
+
+TRACE_SIZE = 256
+
+TRACE_HEATER = "heater"
+TRACE_ROOM = "room"
+
+
+class TraceRecord:
+    """One decision, overwritten in place when the buffer wraps."""
+
+    __slots__ = ("time", "kind", "subject", "result", "reason", "inputs")
+
+    def __init__(self) -> None:
+        self.time: Optional[datetime] = None
+        self.kind = ""
+        self.subject = ""
+        self.result: Any = None
+        self.reason = ""
+        self.inputs: dict[str, Any] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "time": self.time.isoformat() if self.time else None,
+            "kind": self.kind,
+            "subject": self.subject,
+            "result": self.result,
+            "reason": self.reason,
+            "inputs": self.inputs,
+        }
+
+
+class DecisionTrace:
+    """Fixed-size ring buffer of heater decisions and room commands.
+
+    Records are preallocated and reused, so memory use does not grow with
+    uptime.
+    """
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        self._records = [TraceRecord() for _ in range(size)]
+        self._next = 0
+        self.recorded = 0
+
+    def record(
+        self, kind: str, subject: str, result: Any, reason: str, **inputs: Any
+    ) -> None:
+        record = self._records[self._next]
+        record.time = dt_util.utcnow()
+        record.kind = kind
+        record.subject = subject
+        record.result = result
+        record.reason = reason
+        record.inputs = inputs
+
+        self._next = (self._next + 1) % len(self._records)
+        self.recorded += 1
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return recorded decisions, oldest first."""
+        size = len(self._records)
+        if self.recorded < size:
+            records = self._records[: self._next]
+        else:
+            records = self._records[self._next :] + self._records[: self._next]
+        return [record.as_dict() for record in records]
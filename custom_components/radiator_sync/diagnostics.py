@@ -0,0 +1,134 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import RadiatorSyncCoordinator
+from .entity import RadiatorSyncEntity
+from .heater.state_manager import HeaterStateManager
+from .radiator.state_manager import RadiatorStateManager
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _heater_diagnostics(heater: HeaterStateManager) -> dict[str, Any]:
+    return {
+        "entity_id": heater.heater_name,
+        "is_running": heater.is_running,
+        "override_mode": heater.override_mode,
+        "heat_demand": heater.heat_demand,
+        "threshold_heat_demand": heater.threshold_heat_demand,
+        "min_on_seconds": heater.min_on_seconds,
+        "min_off_seconds": heater.min_off_seconds,
+        "last_on": _isoformat(heater.last_on),
+        "last_off": _isoformat(heater.last_off),
+        "pending_command": heater.pending_command,
+        "retry_scheduled": heater.retry_scheduled,
+    }
+
+
+def _room_diagnostics(room: RadiatorStateManager) -> dict[str, Any]:
+    return {
+        "current_temperature": room.current_temperature(),
+        "target_temperature": room.target_temperature(),
+        "current_humidity": room.current_humidity(),
+        "heat_demand": room.get_heat_demand(),
+        "preset_mode": room.preset_mode,
+        "is_heating": room.is_heating(),
+        "climate_entity": room.climate_target,
+        "last_command": room.last_command(),
+        "reported_setpoint": room.reported_setpoint,
+        "commands_issued": room.commands_issued,
+        "commands_suppressed": room.commands_suppressed,
+        "echoes_suppressed": room.echoes_suppressed,
+        "external_changes": room.external_changes,
+        "events_received": room.events_received,
+        "events_conflated": room.events_conflated,
+        "display_updates": room.display_updates,
+        "temp_events": room.temp_events,
+        "temp_events_filtered": room.temp_events_filtered,
+        "mailbox_depth": room.mailbox_depth,
+        "subscriptions": room.subscription_count,
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return a snapshot of the coordinator, built from memory in O(rooms)."""
+    coordinator: RadiatorSyncCoordinator = hass.data[DOMAIN][entry.entry_id][
+        "coordinator"
+    ]
+    persistence = coordinator.persistence
+    actuators = coordinator.actuators
+    watchdog = coordinator.watchdog
+
+    timings = None
+    if coordinator.timings is not None:
+        timings = {
+            stage: {
+                "count": histogram.count,
+                "p50_ms": histogram.percentile(50) * 1000,
+                "p95_ms": histogram.percentile(95) * 1000,
+                "max_ms": histogram.max * 1000,
+            }
+            for stage, histogram in coordinator.timings.histograms.items()
+        }
+
+    return {
+        "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+        "coordinator": {
+            "orchestration_count": coordinator.orchestration_count,
+            "total_heat_demand": coordinator.total_heat_demand,
+            "tracked_entities": coordinator.tracked_entity_count,
+            "subscriptions": coordinator.subscription_count,
+            "listeners": coordinator.listener_count,
+            "entities": len(coordinator.entities),
+            "mailbox_backlog": coordinator.mailbox_backlog,
+            "events_conflated": coordinator.events_conflated,
+            "filter_hit_rate": coordinator.filter_hit_rate,
+        },
+        "entities": {
+            entity.entity_id: {
+                "writes_performed": entity.writes_performed,
+                "writes_skipped": entity.writes_skipped,
+            }
+            for entity in sorted(
+                coordinator.entities, key=lambda entity: entity.entity_id
+            )
+            if isinstance(entity, RadiatorSyncEntity)
+        },
+        "heater": _heater_diagnostics(coordinator.heater),
+        "rooms": {
+            name: _room_diagnostics(room) for name, room in coordinator.rooms.items()
+        },
+        "persistence": {
+            "save_requests": persistence.save_requests,
+            "save_count": persistence.save_count,
+            "bytes_written": persistence.bytes_written,
+            "pending": persistence.pending,
+        },
+        "actuators": {
+            "depth": actuators.depth,
+            "commands_sent": actuators.commands_sent,
+            "commands_dropped": actuators.commands_dropped,
+            "service_calls": actuators.service_calls,
+            "last_wait_ms": actuators.last_wait * 1000,
+            "max_wait_ms": actuators.max_wait * 1000,
+        },
+        "watchdog": {
+            "budget_ms": watchdog.budget * 1000,
+            "strict": watchdog.strict,
+            "degraded": watchdog.degraded,
+            "violations": watchdog.violations,
+            "worst_ms": watchdog.worst * 1000,
+            "last_stage": watchdog.last_stage,
+            "last_room": watchdog.last_room,
+            "coalesce_window_ms": coordinator.coalesce_window * 1000,
+        },
+        "timings": timings,
+    }
@@ -0,0 +1,53 @@
+from abc import abstractmethod
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import RadiatorSyncCoordinator
+
+
+class RadiatorSyncEntity(CoordinatorEntity[RadiatorSyncCoordinator]):
+    """Coordinator entity that only writes state when its attributes changed."""
+
+    def __init__(self, coordinator: RadiatorSyncCoordinator, context: Any = None):
+        super().__init__(coordinator, context)
+        self.writes_performed = 0
+        self.writes_skipped = 0
+        self._last_snapshot: Any = None
+
+    @abstractmethod
+    def _update_attr(self) -> None:
+        """Refresh _attr_* values from the state manager."""
+
+    @abstractmethod
+    def _snapshot(self) -> Any:
+        """Return a compact, comparable snapshot of the published attributes."""
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write state unless the snapshot matches the last written one."""
+        snapshot = self._snapshot()
+        if snapshot == self._last_snapshot:
+            self.writes_skipped += 1
+            return
+
+        self._last_snapshot = snapshot
+        self.writes_performed += 1
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attr()
+        self._async_write_if_changed()
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # The platform writes the initial state right after this
+        self._last_snapshot = self._snapshot()
+        self.coordinator.entities.add(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        await super().async_will_remove_from_hass()
+        self.coordinator.entities.discard(self)
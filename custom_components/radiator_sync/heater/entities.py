@@ -1,12 +1,16 @@
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.components.select import SelectEntity
 from homeassistant.components.number import NumberEntity, NumberMode
-from homeassistant.const import EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.core import callback
+from homeassistant.const import EntityCategory, UnitOfTime
 
-from ..coordinator import RadiatorSyncCoordinator
+from ..const import ACTUATOR_QUEUE, LATENCY_TIMINGS, LOOP_BUDGET, RUNTIME_STATE
+from ..entity import RadiatorSyncEntity
+from ..timing import LatencyHistogram
 
 from .state_manager import HeaterStateManager
 
@@ -15,7 +19,7 @@ import logging
 _LOGGER = logging.getLogger(__name__)
 
 
-class HeaterThresholdNumber(CoordinatorEntity[RadiatorSyncCoordinator], NumberEntity):
+class HeaterThresholdNumber(RadiatorSyncEntity, NumberEntity):
     """Configurable threshold for minimum required heat demand."""
 
     _attr_has_entity_name = True
@@ -25,27 +29,26 @@ class HeaterThresholdNumber(CoordinatorEntity[RadiatorSyncCoordinator], NumberEn
     _attr_mode = NumberMode.AUTO
 
     def __init__(self, state: HeaterStateManager):
-        super().__init__(state.coordinator)
+        super().__init__(state.coordinator, context=state)
         self.heater_state = state
         self._attr_unique_id = f"{state.coordinator.entry.entry_id}_heater_threshold"
         self._attr_native_min_value = 0.0
         self._attr_native_max_value = 100.0
         self._attr_native_step = 1.0
         self._attr_device_info = self.heater_state.device_info()
-        self._attr_native_value = self.heater_state.threshold_heat_demand
+        self._update_attr()
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
+    def _update_attr(self):
         self._attr_native_value = self.heater_state.threshold_heat_demand
-        self.async_write_ha_state()
+
+    def _snapshot(self):
+        return self._attr_native_value
 
     async def async_set_native_value(self, value: float) -> None:
         await self.heater_state.set_threshold_heat_demand(value)
 
 
-class HeaterActiveBinary(
-    CoordinatorEntity[RadiatorSyncCoordinator], BinarySensorEntity
-):
+class HeaterActiveBinary(RadiatorSyncEntity, BinarySensorEntity):
     """Shows if heater is currently heating."""
 
     _attr_has_entity_name = True
@@ -53,16 +56,17 @@ class HeaterActiveBinary(
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(self, state: HeaterStateManager):
-        super().__init__(state.coordinator)
+        super().__init__(state.coordinator, context=state)
         self.heater_state = state
         self._attr_unique_id = f"{state.coordinator.entry.entry_id}_heater_active"
         self._attr_device_info = self.heater_state.device_info()
-        self._attr_is_on = self.heater_state.is_running
+        self._update_attr()
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
+    def _update_attr(self):
         self._attr_is_on = self.heater_state.is_running
-        self.async_write_ha_state()
+
+    def _snapshot(self):
+        return self._attr_is_on
 
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
@@ -73,7 +77,7 @@ class HeaterActiveBinary(
         await self.heater_state.stop()
 
 
-class HeaterHeatDemand(CoordinatorEntity[RadiatorSyncCoordinator], SensorEntity):
+class HeaterHeatDemand(RadiatorSyncEntity, SensorEntity):
     """Number of boiler cycles."""
 
     _attr_has_entity_name = True
@@ -82,19 +86,212 @@ class HeaterHeatDemand(CoordinatorEntity[RadiatorSyncCoordinator], SensorEntity)
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(self, state: HeaterStateManager):
-        super().__init__(state.coordinator)
+        super().__init__(state.coordinator, context=state)
         self.heater_state = state
         self._attr_unique_id = f"{state.coordinator.entry.entry_id}_heater_heat_demand"
         self._attr_device_info = self.heater_state.device_info()
-        self._attr_native_value = self.heater_state.heat_demand
+        self._update_attr()
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
+    def _update_attr(self):
         self._attr_native_value = self.heater_state.heat_demand
-        self.async_write_ha_state()
 
+    def _snapshot(self):
+        return self._attr_native_value
+
+
+class HeaterStorageWrites(RadiatorSyncEntity, SensorEntity):
+    """Number of runtime state writes to disk."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "storage_writes"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, state: HeaterStateManager):
+        super().__init__(state.coordinator, context=RUNTIME_STATE)
+        self.heater_state = state
+        self._attr_unique_id = f"{state.coordinator.entry.entry_id}_storage_writes"
+        self._attr_device_info = self.heater_state.device_info()
+        self._update_attr()
+
+    def _update_attr(self):
+        persistence = self.coordinator.persistence
+        self._attr_native_value = persistence.save_count
+        self._attr_extra_state_attributes = {
+            "save_requests": persistence.save_requests,
+            "bytes_written": persistence.bytes_written,
+            "pending": persistence.pending,
+        }
+
+    def _snapshot(self):
+        return (
+            self._attr_native_value,
+            tuple(self._attr_extra_state_attributes.values()),
+        )
+
+
+class HeaterActuatorQueueDepth(RadiatorSyncEntity, SensorEntity):
+    """Number of heater and thermostat commands waiting to be sent."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "actuator_queue_depth"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, state: HeaterStateManager):
+        super().__init__(state.coordinator, context=ACTUATOR_QUEUE)
+        self.heater_state = state
+        self._attr_unique_id = (
+            f"{state.coordinator.entry.entry_id}_actuator_queue_depth"
+        )
+        self._attr_device_info = self.heater_state.device_info()
+        self._update_attr()
+
+    def _update_attr(self):
+        self._attr_native_value = self.coordinator.actuators.depth
+
+    def _snapshot(self):
+        return self._attr_native_value
+
+
+class HeaterActuatorQueueWait(RadiatorSyncEntity, SensorEntity):
+    """Time the last sent command spent in the actuator queue."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "actuator_queue_wait"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, state: HeaterStateManager):
+        super().__init__(state.coordinator, context=ACTUATOR_QUEUE)
+        self.heater_state = state
+        self._attr_unique_id = f"{state.coordinator.entry.entry_id}_actuator_queue_wait"
+        self._attr_device_info = self.heater_state.device_info()
+        self._update_attr()
+
+    def _update_attr(self):
+        actuators = self.coordinator.actuators
+        self._attr_native_value = round(actuators.last_wait * 1000)
+        self._attr_extra_state_attributes = {
+            "max_wait_ms": round(actuators.max_wait * 1000),
+        }
+
+    def _snapshot(self):
+        return (
+            self._attr_native_value,
+            tuple(self._attr_extra_state_attributes.values()),
+        )
+
+
+class HeaterActuatorCommandsDropped(RadiatorSyncEntity, SensorEntity):
+    """Queued commands replaced by a newer command for the same entity."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "actuator_commands_dropped"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, state: HeaterStateManager):
+        super().__init__(state.coordinator, context=ACTUATOR_QUEUE)
+        self.heater_state = state
+        self._attr_unique_id = (
+            f"{state.coordinator.entry.entry_id}_actuator_commands_dropped"
+        )
+        self._attr_device_info = self.heater_state.device_info()
+        self._update_attr()
+
+    def _update_attr(self):
+        actuators = self.coordinator.actuators
+        self._attr_native_value = actuators.commands_dropped
+        self._attr_extra_state_attributes = {
+            "commands_sent": actuators.commands_sent,
+            "service_calls": actuators.service_calls,
+        }
+
+    def _snapshot(self):
+        return (
+            self._attr_native_value,
+            tuple(self._attr_extra_state_attributes.values()),
+        )
+
+
+class HeaterLoopBudgetViolations(RadiatorSyncEntity, SensorEntity):
+    """Coordinator work chains that exceeded the event loop budget."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "loop_budget_violations"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, state: HeaterStateManager):
+        super().__init__(state.coordinator, context=LOOP_BUDGET)
+        self.heater_state = state
+        self._attr_unique_id = (
+            f"{state.coordinator.entry.entry_id}_loop_budget_violations"
+        )
+        self._attr_device_info = self.heater_state.device_info()
+        self._update_attr()
+
+    def _update_attr(self):
+        watchdog = self.coordinator.watchdog
+        self._attr_native_value = watchdog.violations
+        self._attr_extra_state_attributes = {
+            "budget_ms": watchdog.budget * 1000,
+            "worst_ms": round(watchdog.worst * 1000, 2),
+            "last_stage": watchdog.last_stage,
+            "last_room": watchdog.last_room,
+            "degraded": watchdog.degraded,
+            "coalesce_window_ms": self.coordinator.coalesce_window * 1000,
+        }
+
+    def _snapshot(self):
+        return (
+            self._attr_native_value,
+            tuple(self._attr_extra_state_attributes.values()),
+        )
+
+
+class HeaterStageLatency(RadiatorSyncEntity, SensorEntity):
+    """95th percentile latency of one hot-path stage."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 2
+
+    def __init__(
+        self, state: HeaterStateManager, stage: str, histogram: LatencyHistogram
+    ):
+        super().__init__(state.coordinator, context=LATENCY_TIMINGS)
+        self.heater_state = state
+        self.histogram = histogram
+        self._attr_translation_key = f"latency_{stage}"
+        self._attr_unique_id = f"{state.coordinator.entry.entry_id}_latency_{stage}"
+        self._attr_device_info = self.heater_state.device_info()
+        self._update_attr()
 
-class HeaterModeSelect(CoordinatorEntity[RadiatorSyncCoordinator], SelectEntity):
+    def _update_attr(self):
+        histogram = self.histogram
+        self._attr_native_value = round(histogram.percentile(95) * 1000, 3)
+        self._attr_extra_state_attributes = {
+            "p50_ms": round(histogram.percentile(50) * 1000, 3),
+            "max_ms": round(histogram.max * 1000, 3),
+            "count": histogram.count,
+        }
+
+    def _snapshot(self):
+        return (
+            self._attr_native_value,
+            tuple(self._attr_extra_state_attributes.values()),
+        )
+
+
+class HeaterModeSelect(RadiatorSyncEntity, SelectEntity):
     """Provides 3 modes:
     - auto (radiators drive boiler)
     - on (force boiler on)
@@ -106,17 +303,18 @@ class HeaterModeSelect(CoordinatorEntity[RadiatorSyncCoordinator], SelectEntity)
     _attr_options = ["auto", "on", "off"]
 
     def __init__(self, state: HeaterStateManager):
-        super().__init__(state.coordinator)
+        super().__init__(state.coordinator, context=state)
         self.heater_state = state
 
         self._attr_unique_id = f"{state.coordinator.entry.entry_id}_heater_mode"
         self._attr_device_info = self.heater_state.device_info()
-        self._attr_current_option = self.heater_state._override_mode
+        self._update_attr()
+
+    def _update_attr(self):
+        self._attr_current_option = self.heater_state.override_mode
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_current_option = self.heater_state._override_mode
-        self.async_write_ha_state()
+    def _snapshot(self):
+        return self._attr_current_option
 
     async def async_select_option(self, option: str):
         if option not in ["auto", "on", "off"]:
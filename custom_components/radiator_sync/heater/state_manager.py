@@ -1,8 +1,9 @@
 from typing import Optional, Callable, Any
 from datetime import datetime
+from time import monotonic
 
 from homeassistant.core import callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_reg
 from homeassistant.helpers.device_registry import async_get as async_get_dev_reg
@@ -13,7 +14,12 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..coordinator import RadiatorSyncCoordinator
 
-from ..const import CONF_HEATER, CONF_MIN_ON, CONF_MIN_OFF, DOMAIN
+from ..const import CONF_HEATER, CONF_MIN_ON, CONF_MIN_OFF, DOMAIN, ROLE_HEATER
+from ..actuator import PRIORITY_HEATER
+from ..decision_trace import TRACE_HEATER
+
+# How long a switch command is considered in flight without a state report
+SWITCH_COMMAND_TIMEOUT = 30.0
 
 
 class HeaterStateManager:
@@ -35,6 +41,8 @@ class HeaterStateManager:
         self._override_mode = "auto"
 
         self._unsub: Optional[Callable] = None
+        self._unsub_retry: Optional[Callable] = None
+        self._pending_command: Optional[tuple[str, float]] = None
 
     def load_state(self, state: dict):
         """Load state from persistence."""
@@ -58,8 +66,8 @@ class HeaterStateManager:
             "override_mode": self._override_mode,
         }
 
-    async def _persist(self):
-        await self.coordinator.async_save_runtime_state()
+    def _persist(self):
+        self.coordinator.async_save_runtime_state(self)
 
     def device_info(self) -> DeviceInfo:
         hass = self.coordinator.hass
@@ -80,27 +88,42 @@ class HeaterStateManager:
             model=model,
         )
 
+    @property
+    def override_mode(self) -> str:
+        """Return the override mode: auto, on or off."""
+        return self._override_mode
+
+    @property
+    def pending_command(self) -> Optional[str]:
+        """Return the switch service sent but not yet confirmed, if any."""
+        return self._pending_command[0] if self._pending_command else None
+
+    @property
+    def retry_scheduled(self) -> bool:
+        """Return True if a decision blocked by min on/off time will retry."""
+        return self._unsub_retry is not None
+
     async def set_override_mode(self, mode: str) -> None:
         """Change override mode, forcing boiler state if required."""
 
         self._override_mode = mode
-        await self._persist()
+        self._cancel_retry()
+        self._persist()
         await self.notify()
 
         if mode == "on":
-            await self.coordinator.hass.services.async_call(
-                "switch", "turn_on", {"entity_id": self.heater_name}, blocking=False
-            )
+            await self._switch("turn_on")
         elif mode == "off":
-            await self.coordinator.hass.services.async_call(
-                "switch", "turn_off", {"entity_id": self.heater_name}, blocking=False
-            )
+            await self._switch("turn_off")
+        else:
+            await self._evaluate()
 
     async def set_threshold_heat_demand(self, value: float) -> None:
         """Set minimum heat demand required to activate heater."""
         self.threshold_heat_demand = max(0.0, min(100.0, value))
-        await self._persist()
+        self._persist()
         await self.notify()  # update entities showing threshold
+        await self._evaluate()
 
     async def apply_heat_demand(self, demand: float) -> None:
         """Turn boiler on/off based on demand (0–100%) with anti-cycling logic."""
@@ -109,12 +132,28 @@ class HeaterStateManager:
             return
 
         self.heat_demand = demand
-        await self._persist()
-        await self.notify()
+        self._persist()
+        # Called from orchestration, which fans out published updates itself
+        self.coordinator.async_publish(self)
+
+        await self._evaluate()
+
+    async def async_evaluate(self) -> None:
+        """Decide for the current demand, even if it has not changed."""
+        await self._evaluate()
+
+    async def _evaluate(self) -> None:
+        """Decide whether the boiler should switch for the current demand.
+
+        If the decision is blocked by an anti-short-cycle window, a single
+        timer is armed for the moment the window ends to decide again.
+        """
+        self._cancel_retry()
 
         if self._override_mode != "auto":
             return  # ignore heat demand when overridden
 
+        demand = self.heat_demand
         now = datetime.now()
         should_run = (demand >= self.threshold_heat_demand) or (
             self.is_running and demand > 0.0
@@ -125,11 +164,11 @@ class HeaterStateManager:
                 off_time = (now - self.last_off).total_seconds()
                 if off_time < self.min_off_seconds:
                     # Still in anti-short-cycle off window
+                    self._trace("blocked", "min_off", off_time=round(off_time))
+                    self._schedule_retry(self.min_off_seconds - off_time)
                     return
 
-            await self.coordinator.hass.services.async_call(
-                "switch", "turn_on", {"entity_id": self.heater_name}, blocking=False
-            )
+            await self._switch("turn_on", "demand")
             return
 
         if not should_run and self.is_running:
@@ -137,19 +176,63 @@ class HeaterStateManager:
                 on_time = (now - self.last_on).total_seconds()
                 if on_time < self.min_on_seconds:
                     # Still in anti-short-cycle on window
+                    self._trace("blocked", "min_on", on_time=round(on_time))
+                    self._schedule_retry(self.min_on_seconds - on_time)
                     return
 
-            await self.coordinator.hass.services.async_call(
-                "switch", "turn_off", {"entity_id": self.heater_name}, blocking=False
-            )
+            await self._switch("turn_off", "no_demand")
             return
 
+    def _trace(self, result: str, reason: str, **inputs: Any) -> None:
+        self.coordinator.trace.record(
+            TRACE_HEATER,
+            self.heater_name,
+            result,
+            reason,
+            demand=self.heat_demand,
+            threshold=self.threshold_heat_demand,
+            is_running=self.is_running,
+            **inputs,
+        )
+
+    async def _switch(self, service: str, reason: str = "override") -> None:
+        """Call a switch service unless the same command is still in flight."""
+        now = monotonic()
+        if self._pending_command is not None:
+            command, sent = self._pending_command
+            if command == service and now - sent < SWITCH_COMMAND_TIMEOUT:
+                return
+
+        self._pending_command = (service, now)
+        self._trace(service, reason)
+        self.coordinator.actuators.async_enqueue(
+            "switch", service, self.heater_name, {}, PRIORITY_HEATER
+        )
+
+    @callback
+    def _schedule_retry(self, delay: float) -> None:
+        self._unsub_retry = async_call_later(
+            self.coordinator.hass, delay, self._async_window_expired
+        )
+
+    @callback
+    def _cancel_retry(self) -> None:
+        if self._unsub_retry:
+            self._unsub_retry()
+            self._unsub_retry = None
+
+    async def _async_window_expired(self, _now: datetime) -> None:
+        """Re-run the decision once an anti-short-cycle window has ended."""
+        self._unsub_retry = None
+        await self._evaluate()
+
     # ----------------------------
     # Listener registration
     # ----------------------------
 
     async def notify(self):
-        await self.coordinator.async_refresh_entities()
+        self.coordinator.async_publish(self)
+        await self.coordinator.async_refresh_entities_coalesced()
 
     # ----------------------------
     # Heater state change logic
@@ -158,6 +241,7 @@ class HeaterStateManager:
     async def update_from_state(self, new_state: str):
         """Update running/cycle/runtime logic from switch state."""
         now_running = new_state == "on"
+        self._pending_command = None
 
         if now_running == self.is_running:
             return
@@ -165,10 +249,15 @@ class HeaterStateManager:
         if now_running and not self.is_running:
             # Started
             self.last_on = datetime.now()
+        else:
+            # Stopped
+            self.last_off = datetime.now()
 
         self.is_running = now_running
-        await self._persist()
+        self._persist()
         await self.notify()
+        # Any pending retry was computed for the previous state
+        await self._evaluate()
 
     # ----------------------------
     # HA binding lifecycle
@@ -178,14 +267,14 @@ class HeaterStateManager:
         """Start listening to HA switch state of the heater."""
 
         @callback
-        async def _changed(ev):
-            st = ev.data.get("new_state")
+        def _changed(st):
             if st:
-                await self.update_from_state(st.state)
+                self.coordinator.hass.async_create_task(
+                    self.update_from_state(st.state)
+                )
 
-        # Subscribe to entity state changes
-        self._unsub = async_track_state_change_event(
-            self.coordinator.hass, [self.heater_name], _changed
+        self._unsub = self.coordinator.async_track_entity(
+            self.heater_name, ROLE_HEATER, self, _changed
         )
 
         # Initial state read
@@ -195,6 +284,7 @@ class HeaterStateManager:
 
     async def stop(self):
         """Stop state tracking."""
+        self._cancel_retry()
         if self._unsub:
             self._unsub()
             self._unsub = None
@@ -0,0 +1,131 @@
+from collections import deque
+from time import monotonic
+from typing import Any, Callable, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+
+from .const import DEFAULT_SAVE_DELAY, DEFAULT_MAX_WRITES_PER_HOUR
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+WRITE_BUDGET_PERIOD = 3600.0
+
+
+class RuntimeStatePersistence:
+    """Write-behind store for runtime state of heater and room managers.
+
+    State managers only mark themselves dirty. Dirty entries are serialized
+    lazily when the delayed save fires, and saves are spread out so that no
+    more than ``max_writes_per_hour`` hit the disk.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        save_delay: float = DEFAULT_SAVE_DELAY,
+        max_writes_per_hour: int = DEFAULT_MAX_WRITES_PER_HOUR,
+        on_write: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.hass = hass
+        self._on_write = on_write
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, key)
+        self.save_delay = save_delay
+        self.max_writes_per_hour = max_writes_per_hour
+
+        self._state: dict[str, Any] = {}
+        self._dirty: dict[str, Callable[[], dict]] = {}
+        self._save_pending = False
+        self._write_times: deque[float] = deque()
+
+        self.save_requests = 0
+        self.save_count = 0
+        self.bytes_written = 0
+
+    @property
+    def pending(self) -> int:
+        """Return number of dirty entries not yet written."""
+        return len(self._dirty)
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Return the last loaded or written runtime state."""
+        return self._state
+
+    async def async_load(self) -> dict[str, Any]:
+        """Load persisted runtime state."""
+        if data := await self._store.async_load():
+            self._state = data
+        return self._state
+
+    @callback
+    def async_mark_dirty(self, key: str, get_state: Callable[[], dict]) -> None:
+        """Mark an entry dirty and schedule a delayed save."""
+        self.save_requests += 1
+        self._dirty[key] = get_state
+
+        if self._save_pending:
+            return
+
+        # Only schedule once per window; Store would otherwise push the
+        # write further out on every call.
+        self._save_pending = True
+        self._store.async_delay_save(self._collect, self._next_delay())
+
+    @callback
+    def async_remove(self, key: str) -> None:
+        """Drop an entry, e.g. for a removed room, and schedule a save."""
+        self._dirty.pop(key, None)
+        if self._state.pop(key, None) is None:
+            return
+
+        # Nothing dirty to collect, but the entry must disappear from disk
+        self.save_requests += 1
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._collect, self._next_delay())
+
+    async def async_flush(self) -> None:
+        """Write pending state immediately, ignoring delay and budget."""
+        if not self._save_pending:
+            return
+        await self._store.async_save(self._collect())
+
+    def _next_delay(self) -> float:
+        """Return delay honouring both the save window and the write budget."""
+        now = monotonic()
+        while self._write_times and now - self._write_times[0] >= WRITE_BUDGET_PERIOD:
+            self._write_times.popleft()
+
+        if len(self._write_times) < self.max_writes_per_hour:
+            return self.save_delay
+
+        budget_wait = self._write_times[0] + WRITE_BUDGET_PERIOD - now
+        _LOGGER.debug("Write budget exhausted, delaying save by %.0fs", budget_wait)
+        return max(self.save_delay, budget_wait)
+
+    @callback
+    def _collect(self) -> dict[str, Any]:
+        """Return the state to write and notify about the write."""
+        data = self._serialize()
+        if self._on_write is not None:
+            self._on_write()
+        return data
+
+    def _serialize(self) -> dict[str, Any]:
+        """Serialize dirty entries into the cached state and account the write."""
+        for key, get_state in self._dirty.items():
+            self._state[key] = get_state()
+        self._dirty.clear()
+        self._save_pending = False
+
+        self.save_count += 1
+        self.bytes_written += len(json_bytes(self._state))
+        self._write_times.append(monotonic())
+        return dict(self._state)
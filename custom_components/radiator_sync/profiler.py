@@ -0,0 +1,127 @@
+import asyncio
+import cProfile
+import pstats
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+PACKAGE_DIR = str(Path(__file__).parent)
+
+# Source files grouped into the components memory is reported for
+MEMORY_COMPONENTS = {
+    "coordinator": (
+        "coordinator.py",
+        "actuator.py",
+        "persistence.py",
+        "decision_trace.py",
+        "timing.py",
+    ),
+    "state_managers": ("state_manager.py",),
+    "entities": (
+        "entity.py",
+        "entities.py",
+        "binary_sensor.py",
+        "climate.py",
+        "number.py",
+        "select.py",
+        "sensor.py",
+    ),
+}
+
+MEMORY_TOP_LINES = 25
+
+
+def _component(filename: str) -> str:
+    name = Path(filename).name
+    for component, files in MEMORY_COMPONENTS.items():
+        if name in files:
+            return component
+    return "other"
+
+
+def _write_stats(
+    profiler: cProfile.Profile,
+    snapshot: tracemalloc.Snapshot,
+    stats_path: str,
+    memory_path: str,
+) -> None:
+    """Write the integration's share of the profile and the memory report."""
+    stats = pstats.Stats(profiler)
+    stats.stats = {  # type: ignore[attr-defined]
+        func: timing
+        for func, timing in stats.stats.items()  # type: ignore[attr-defined]
+        if func[0].startswith(PACKAGE_DIR)
+    }
+    stats.dump_stats(stats_path)
+
+    with open(memory_path, "w", encoding="utf-8") as file:
+        for statistic in snapshot.statistics("lineno")[:MEMORY_TOP_LINES]:
+            file.write(f"{statistic}\n")
+
+
+async def async_profile(hass: HomeAssistant, duration: float) -> dict[str, Any]:
+    """Profile the integration for duration seconds.
+
+    cProfile runs on the event loop thread for the whole window, and only
+    functions defined in this integration are kept in the stats file, each
+    with the time spent in everything it called. tracemalloc reports memory
+    allocated by the integration during the window that is still held at
+    its end, grouped into coordinator, state managers and entities.
+    """
+    started = time.time()
+    stats_path = hass.config.path(f"radiator_sync_profile.{started:.0f}.cprof")
+    memory_path = hass.config.path(f"radiator_sync_memory.{started:.0f}.txt")
+
+    finished = asyncio.Event()
+
+    @callback
+    def _finished(_now: datetime) -> None:
+        finished.set()
+
+    was_tracing = tracemalloc.is_tracing()
+    profiler = cProfile.Profile()
+    unsub = None
+    try:
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            profiler.enable()
+        except ValueError as err:
+            # Another profiler is already active (Python 3.12+)
+            raise HomeAssistantError(f"Cannot start cProfile: {err}") from err
+        unsub = async_call_later(hass, duration, _finished)
+        await finished.wait()
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(True, f"{PACKAGE_DIR}/*")]
+        )
+    finally:
+        if unsub is not None:
+            unsub()
+        profiler.disable()
+        if not was_tracing:
+            tracemalloc.stop()
+
+    memory = dict.fromkeys([*MEMORY_COMPONENTS, "other"], 0)
+    for statistic in snapshot.statistics("filename"):
+        memory[_component(statistic.traceback[0].filename)] += statistic.size
+
+    await hass.async_add_executor_job(
+        _write_stats, profiler, snapshot, stats_path, memory_path
+    )
+    _LOGGER.info("Profile written to %s, memory held (bytes): %s", stats_path, memory)
+    return {
+        "stats_file": stats_path,
+        "memory_file": memory_path,
+        "memory_bytes": memory,
+    }
@@ -12,16 +12,14 @@ from homeassistant.const import (
     EntityCategory,
 )
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.core import callback
 from typing import cast
 
 
 from .state_manager import RadiatorStateManager
-from ..coordinator import RadiatorSyncCoordinator
+from ..entity import RadiatorSyncEntity
 
 
-class RadiatorRoomHeatDemand(CoordinatorEntity[RadiatorSyncCoordinator], SensorEntity):
+class RadiatorRoomHeatDemand(RadiatorSyncEntity, SensorEntity):
     """Current heat demand for the room."""
 
     _attr_has_entity_name = True
@@ -31,25 +29,55 @@ class RadiatorRoomHeatDemand(CoordinatorEntity[RadiatorSyncCoordinator], SensorE
     _attr_state_class = SensorStateClass.MEASUREMENT
 
     def __init__(self, state: RadiatorStateManager):
-        super().__init__(state.coordinator)
+        super().__init__(state.coordinator, context=state)
         self.radiator_state = state
         self._attr_unique_id = (
             f"{state.coordinator.entry.entry_id}_{state.room_name}_heat_demand"
         )
         self._attr_device_info = self.radiator_state.device_info()
-        self._attr_native_value = self.radiator_state.get_heat_demand()
+        self._update_attr()
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+    def _update_attr(self):
         self._attr_native_value = self.radiator_state.get_heat_demand()
-        self.async_write_ha_state()
 
+    def _snapshot(self):
+        return self._attr_native_value
 
-class RadiatorSyncRoomClimate(
-    CoordinatorEntity[RadiatorSyncCoordinator],
-    ClimateEntity,
-):
+
+class RadiatorRoomSetpointCommands(RadiatorSyncEntity, SensorEntity):
+    """Number of setpoint commands sent to the linked thermostat."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "room_setpoint_commands"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, state: RadiatorStateManager):
+        super().__init__(state.coordinator, context=state)
+        self.radiator_state = state
+        self._attr_unique_id = (
+            f"{state.coordinator.entry.entry_id}_{state.room_name}_setpoint_commands"
+        )
+        self._attr_device_info = self.radiator_state.device_info()
+        self._update_attr()
+
+    def _update_attr(self):
+        self._attr_native_value = self.radiator_state.commands_issued
+        self._attr_extra_state_attributes = {
+            "suppressed": self.radiator_state.commands_suppressed,
+            "last_command": self.radiator_state.last_command(),
+            "echoes_suppressed": self.radiator_state.echoes_suppressed,
+            "external_changes": self.radiator_state.external_changes,
+        }
+
+    def _snapshot(self):
+        return (
+            self._attr_native_value,
+            tuple(self._attr_extra_state_attributes.values()),
+        )
+
+
+class RadiatorSyncRoomClimate(RadiatorSyncEntity, ClimateEntity):
     """Climate entity for a radiator sync controlled room."""
 
     _attr_has_entity_name = True
@@ -62,7 +90,7 @@ class RadiatorSyncRoomClimate(
     _attr_hvac_mode = HVACMode.HEAT
 
     def __init__(self, state: RadiatorStateManager):
-        super().__init__(state.coordinator)
+        super().__init__(state.coordinator, context=state)
         self.radiator_state = state
         self._attr_unique_id = (
             f"{state.coordinator.entry.entry_id}_{state.room_name}_climate"
@@ -88,15 +116,20 @@ class RadiatorSyncRoomClimate(
             ),
         )
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._update_attr()
-        self.async_write_ha_state()
+    def _snapshot(self):
+        return (
+            self._attr_current_temperature,
+            self._attr_target_temperature,
+            self._attr_current_humidity,
+            tuple(self._attr_preset_modes or ()),
+            self._attr_preset_mode,
+            self._attr_hvac_action,
+            self._attr_hvac_mode,
+        )
 
     async def async_set_hvac_mode(self, hvac_mode):
         self._attr_hvac_mode = hvac_mode
-        self.async_write_ha_state()
+        self._async_write_if_changed()
 
     async def async_set_temperature(self, **kwargs):
         if ATTR_TEMPERATURE in kwargs:
@@ -108,6 +141,11 @@ class RadiatorSyncRoomClimate(
 
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(
+                self._handle_coordinator_update, self.radiator_state.display_key
+            )
+        )
         await self.radiator_state.start()
 
     async def async_will_remove_from_hass(self):
@@ -1,7 +1,8 @@
 from typing import Optional, Callable, Mapping, Any
+from functools import partial
+from time import monotonic
 
 from homeassistant.core import callback
-from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from typing import TYPE_CHECKING
@@ -12,20 +13,34 @@ if TYPE_CHECKING:
 
 from ..const import (
     DOMAIN,
+    GLOBAL_PRESET,
     CONF_NAME,
     CONF_ROOM_CLIMATE,
     CONF_SENSOR_TEMP,
     CONF_SENSOR_HUM,
     CONF_HYSTERESIS,
     DEFAULT_HYSTERESIS,
-    CONF_PRESETS,
-    DEFAULT_PRESETS,
+    CONF_DEADBAND,
+    DEFAULT_DEADBAND,
+    ROLE_TEMP,
+    ROLE_HUMIDITY,
+    ROLE_TRV,
+)
+
+from ..decision_trace import TRACE_ROOM
+from ..actuator import (
+    FAR_BELOW_TARGET_DEMAND,
+    PRIORITY_FAR_BELOW_TARGET,
+    PRIORITY_NEAR_TARGET,
 )
 
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long a sent setpoint is expected to be echoed back by the thermostat
+COMMAND_ECHO_TIMEOUT = 30.0
+
 
 class RadiatorStateManager:
     """Central state + update/notify logic for a single room radiator."""
@@ -36,12 +51,7 @@ class RadiatorStateManager:
         self, coordinator: "RadiatorSyncCoordinator", config: Mapping[str, Any]
     ) -> None:
         self.coordinator = coordinator
-
-        self.room_name = config.get(CONF_NAME)
-        self.sensor_temp = config.get(CONF_SENSOR_TEMP)
-        self.hum_sensor = config.get(CONF_SENSOR_HUM)
-        self.hysteresis = config.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS)
-        self.climate_target = config.get(CONF_ROOM_CLIMATE)
+        self._apply_config(config)
 
         self._is_heating = False
         self._current_temp: Optional[float] = None
@@ -50,13 +60,74 @@ class RadiatorStateManager:
         self._climate_min_temp = None
         self._climate_max_temp = None
         self._active_preset: Optional[str] = None
+        self._presets: Optional[dict[str, float]] = None
+        self._preset_modes: Optional[list[str]] = None
+        self._heat_demand: Optional[int] = None
+
+        # Setpoint deduplication for the linked thermostat
+        self._commanded_setpoint: Optional[float] = None
+        self._reported_setpoint: Optional[float] = None
+        # Latest command still waiting on the actuator queue
+        self._queued_setpoint: Optional[float] = None
+        # Sent commands not yet reported back: expected setpoint -> monotonic deadline
+        self._in_flight: dict[float, float] = {}
+        self.echoes_suppressed = 0
+        self.external_changes = 0
+        self.commands_issued = 0
+        self.commands_suppressed = 0
+
+        # Update key for display-only changes, e.g. humidity, which only the
+        # room's climate entity subscribes to
+        self.display_key = (self, "display")
+
+        # Latest unprocessed sample per role (parsed temperature and TRV
+        # setpoint, State for humidity), drained by the coordinator
+        self._mailbox: dict[str, Any] = {}
+        self.events_received = 0
+        self.events_conflated = 0
+        self.display_updates = 0
+        self.temp_events = 0
+        self.temp_events_filtered = 0
 
         self._unsubs: list[Callable] = []
 
+    def _apply_config(self, config: Mapping[str, Any]) -> None:
+        # Required by the config flow
+        self.room_name: str = config[CONF_NAME]
+        self.sensor_temp = config.get(CONF_SENSOR_TEMP)
+        self.hum_sensor = config.get(CONF_SENSOR_HUM)
+        self.hysteresis = config.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS)
+        self.deadband = config.get(CONF_DEADBAND, DEFAULT_DEADBAND)
+        self.climate_target = config.get(CONF_ROOM_CLIMATE)
+
+    def update_config(self, config: Mapping[str, Any]) -> None:
+        """Apply edited room options; the caller restarts tracking."""
+        old_climate = self.climate_target
+        self._apply_config(config)
+        self.invalidate_presets()
+        self.invalidate_heat_demand()
+
+        if self.climate_target != old_climate:
+            # Limits and setpoint history belong to the previous thermostat
+            self._climate_min_temp = None
+            self._climate_max_temp = None
+            self._commanded_setpoint = None
+            self._queued_setpoint = None
+            self._in_flight.clear()
+            self._update_reported_setpoint(None)
+
     @property
     def presets(self) -> dict[str, float]:
-        """Return preset mapping from options, resolved for this room."""
-        raw_presets = self.coordinator.entry.options.get(CONF_PRESETS, DEFAULT_PRESETS)
+        """Return preset mapping from options, resolved for this room.
+
+        The table is compiled on first use and kept until the presets or
+        this room's configuration change.
+        """
+        if self._presets is None:
+            self._presets = self._resolve_presets(self.coordinator.presets_conf)
+        return self._presets
+
+    def _resolve_presets(self, raw_presets: Mapping[str, Any]) -> dict[str, float]:
         resolved_presets = {}
         for name, data in raw_presets.items():
             if isinstance(data, (int, float)):
@@ -68,10 +139,17 @@ class RadiatorStateManager:
                 resolved_presets[name] = overrides.get(self.room_name, default_temp)
         return resolved_presets
 
+    def invalidate_presets(self):
+        """Drop the compiled preset table after an options change."""
+        self._presets = None
+        self._preset_modes = None
+
     @property
     def preset_modes(self) -> list[str]:
         """Return list of available preset modes."""
-        return list(self.presets.keys())
+        if self._preset_modes is None:
+            self._preset_modes = list(self.presets)
+        return self._preset_modes
 
     @property
     def preset_mode(self) -> Optional[str]:
@@ -80,17 +158,42 @@ class RadiatorStateManager:
 
     async def set_preset_mode(self, preset_mode: str):
         """Set new preset mode and update target temperature."""
-        if preset_mode not in self.presets:
-            _LOGGER.error("Preset mode %s not found in %s", preset_mode, self.room_name)
+        if not self.apply_preset(preset_mode):
             return
 
-        self._active_preset = preset_mode
-        await self.set_target_temperature(self.presets[preset_mode])
+        self._persist()
+        await self.notify()
+
+    def apply_preset(self, preset_mode: Optional[str]) -> bool:
+        """Switch preset and target without commanding, persisting or notifying.
+
+        Passing None only clears the active preset. Returns False if the
+        preset does not exist for this room.
+        """
+        if preset_mode is None:
+            self._set_active_preset(None)
+            return True
+
+        presets = self.presets
+        if preset_mode not in presets:
+            _LOGGER.error("Preset mode %s not found in %s", preset_mode, self.room_name)
+            return False
+
+        self._set_active_preset(preset_mode)
+        self._target_temp = presets[preset_mode]
+        self.invalidate_heat_demand()
+        return True
+
+    def _set_active_preset(self, preset_mode: Optional[str]):
+        if preset_mode != self._active_preset:
+            self._active_preset = preset_mode
+            self.coordinator.async_publish(GLOBAL_PRESET)
 
     def load_state(self, state: dict):
         """Load state from persistence."""
         if "target_temp" in state:
             self._target_temp = state["target_temp"]
+            self.invalidate_heat_demand()
         if "active_preset" in state:
             self._active_preset = state["active_preset"]
 
@@ -101,8 +204,8 @@ class RadiatorStateManager:
             "active_preset": self._active_preset,
         }
 
-    async def _persist(self):
-        await self.coordinator.async_save_runtime_state()
+    def _persist(self):
+        self.coordinator.async_save_runtime_state(self)
 
     def device_info(self) -> DeviceInfo:
         return DeviceInfo(
@@ -122,6 +225,7 @@ class RadiatorStateManager:
 
     async def notify(self):
         """Notifies coordinator to refresh HA state."""
+        self.coordinator.async_publish(self)
         await self.coordinator.async_refresh_entities()
 
         # also apply linked climate control if target & current available
@@ -142,6 +246,12 @@ class RadiatorStateManager:
         return self._is_heating
 
     def get_heat_demand(self) -> int:
+        """Return heat demand 0–100%, cached until temperatures change."""
+        if self._heat_demand is None:
+            self._heat_demand = self.compute_heat_demand()
+        return self._heat_demand
+
+    def compute_heat_demand(self) -> int:
         """Return heat demand 0–100% based on target/current difference."""
         if self._current_temp is None or self._target_temp is None:
             return 0
@@ -149,6 +259,11 @@ class RadiatorStateManager:
         delta = max(0.0, self._target_temp - self._current_temp)
         return round(min(delta / self.MAX_DELTA, 1.0) * 100.0)
 
+    def invalidate_heat_demand(self):
+        """Drop cached demand and let the coordinator pick up the delta."""
+        self._heat_demand = None
+        self.coordinator.mark_demand_stale(self)
+
     # ----------------------------
     # Temperature & target changes
     # ----------------------------
@@ -157,11 +272,12 @@ class RadiatorStateManager:
         """Update target and forward to actual thermostat entity, if exists."""
         # If the new temperature doesn't match the current preset's temperature, clear the preset
         if self._active_preset and self.presets.get(self._active_preset) != new_t:
-            self._active_preset = None
+            self._set_active_preset(None)
 
         self._target_temp = new_t
+        self.invalidate_heat_demand()
         await self._apply_climate_control()
-        await self._persist()
+        self._persist()
         await self.notify()
 
     # ----------------------------
@@ -183,14 +299,18 @@ class RadiatorStateManager:
         # too cold → go to max
         if self._current_temp < low:
             _, max_temp = await self._get_climate_min_max()
-            await self._set_climate_temp(high + 5 if max_temp is None else max_temp)
+            await self._set_climate_temp(
+                high + 5 if max_temp is None else max_temp, "below_band"
+            )
             self._is_heating = True
             return
 
         # too warm → go to min
         elif self._current_temp > high:
             min_temp, _ = await self._get_climate_min_max()
-            await self._set_climate_temp(low - 5 if min_temp is None else min_temp)
+            await self._set_climate_temp(
+                low - 5 if min_temp is None else min_temp, "above_band"
+            )
             self._is_heating = False
             return
 
@@ -211,82 +331,119 @@ class RadiatorStateManager:
 
         return self._climate_min_temp, self._climate_max_temp
 
-    async def _set_climate_temp(self, value: float):
-        """Send set_temperature only if entity exists."""
+    def last_command(self) -> Optional[float]:
+        return self._commanded_setpoint
+
+    def _setpoint_unchanged(self, value: float) -> bool:
+        """Return True if commanding value would not change the thermostat.
+
+        While the latest command is queued or in flight, the reported
+        setpoint is about to be replaced, so only the commanded value counts.
+        """
+        commanded = self._commanded_setpoint
+        if commanded is not None and (
+            commanded == self._queued_setpoint or self._is_in_flight(commanded)
+        ):
+            return value == commanded
+        return self._reported_setpoint == value
+
+    def _is_in_flight(self, value: float) -> bool:
+        deadline = self._in_flight.get(value)
+        if deadline is None:
+            return False
+        if monotonic() > deadline:
+            del self._in_flight[value]
+            return False
+        return True
+
+    @property
+    def reported_setpoint(self) -> Optional[float]:
+        """Return the setpoint last reported by the thermostat."""
+        return self._reported_setpoint
+
+    def _update_reported_setpoint(self, value: Optional[float]):
+        self._reported_setpoint = value
+
+    async def _set_climate_temp(self, value: float, reason: str):
+        """Queue set_temperature only if entity exists and the setpoint differs."""
         if not self.climate_target:
             return
-        await self.coordinator.hass.services.async_call(
-            "climate",
-            "set_temperature",
-            {"entity_id": self.climate_target, "temperature": value},
-            blocking=False,
+
+        if self._setpoint_unchanged(value):
+            self.commands_suppressed += 1
+            return
+
+        self._commanded_setpoint = value
+        self._queued_setpoint = value
+        self.commands_issued += 1
+        self.coordinator.trace.record(
+            TRACE_ROOM,
+            self.room_name,
+            value,
+            reason,
+            current=self._current_temp,
+            target=self._target_temp,
+            hysteresis=self.hysteresis,
+        )
+        priority = (
+            PRIORITY_FAR_BELOW_TARGET
+            if self.get_heat_demand() >= FAR_BELOW_TARGET_DEMAND
+            else PRIORITY_NEAR_TARGET
+        )
+        self.coordinator.async_queue_setpoint(
+            self.climate_target,
+            value,
+            priority,
+            partial(self._async_setpoint_sent, self.climate_target, value),
         )
 
+    @callback
+    def _async_setpoint_sent(self, entity_id: str, value: float) -> None:
+        """Expect the echo of a setpoint from when the queue sends it."""
+        if entity_id != self.climate_target:
+            return
+        if value == self._queued_setpoint:
+            self._queued_setpoint = None
+        self._in_flight[value] = monotonic() + COMMAND_ECHO_TIMEOUT
+
     # ----------------------------
     # Sensor tracking
     # ----------------------------
 
     async def start(self):
-        """Begin tracking temperature and climate target changes."""
+        """Begin tracking temperature and climate target changes.
 
-        @callback
-        async def hum_update(ev):
-            st = ev.data.get("new_state")
-            if st and st.state not in ("unknown", "unavailable"):
-                try:
-                    self._current_humidity = float(st.state)
-                except Exception as e:
-                    _LOGGER.error(
-                        f"Radiator '{self.room_name}': invalid humidity state: {st.state}: {e}"
-                    )
-                await self.notify()
-
-        @callback
-        async def temp_update(ev):
-            st = ev.data.get("new_state")
-            if st and st.state not in ("unknown", "unavailable"):
-                try:
-                    self._current_temp = float(st.state)
-                except Exception as e:
-                    _LOGGER.error(
-                        f"Radiator '{self.room_name}': invalid temperature state: {st.state}: {e}"
-                    )
-                await self.notify()
-                await self._apply_climate_control()
+        Initial states are read and applied by the coordinator, in one batch
+        during its startup phase or in the next coalesced pass afterwards.
+        """
 
-        @callback
-        async def hw_target_update(ev):
-            st = ev.data.get("new_state")
-            if st and "temperature" in st.attributes:
-                await self._apply_climate_control()
-
-        # track sensor and target climate
+        # track sensor and target climate through the coordinator dispatcher
+        track = self.coordinator.async_track_entity
         if self.sensor_temp:
             self._unsubs.append(
-                async_track_state_change_event(
-                    self.coordinator.hass, [self.sensor_temp], temp_update
-                )
+                track(self.sensor_temp, ROLE_TEMP, self, self._temp_update)
             )
 
         if self.hum_sensor:
             self._unsubs.append(
-                async_track_state_change_event(
-                    self.coordinator.hass, [self.hum_sensor], hum_update
-                )
+                track(self.hum_sensor, ROLE_HUMIDITY, self, self._hum_update)
             )
 
         if self.climate_target:
             self._unsubs.append(
-                async_track_state_change_event(
-                    self.coordinator.hass, [self.climate_target], hw_target_update
-                )
+                track(self.climate_target, ROLE_TRV, self, self._hw_target_update)
             )
 
+        self.coordinator.async_room_started(self)
+
+    def read_initial_state(self):
+        """Read current sensor and thermostat states after start."""
         if self.sensor_temp:
             cl_state = self.coordinator.hass.states.get(self.sensor_temp)
             if cl_state:
                 try:
                     self._current_temp = float(cl_state.state)
+                    self.invalidate_heat_demand()
                 except Exception as e:
                     _LOGGER.error(
                         f"Radiator '{self.room_name}': invalid temperature state: {cl_state.state}: {e}"
@@ -296,10 +453,151 @@ class RadiatorStateManager:
             st = self.coordinator.hass.states.get(self.climate_target)
             if st and "temperature" in st.attributes:
                 self._target_temp = st.attributes["temperature"]
-
-        await self.notify()
+                self._update_reported_setpoint(st.attributes["temperature"])
+                self.invalidate_heat_demand()
 
     async def stop(self):
         for u in self._unsubs:
             u()
         self._unsubs.clear()
+        self._mailbox.clear()
+
+    # ----------------------------
+    # Event mailbox
+    # ----------------------------
+
+    @callback
+    def _temp_update(self, st):
+        if not st or st.state in ("unknown", "unavailable"):
+            return
+        try:
+            value = float(st.state)
+        except ValueError as e:
+            _LOGGER.error(
+                f"Radiator '{self.room_name}': invalid temperature state: {st.state}: {e}"
+            )
+            return
+
+        self.temp_events += 1
+        if self._within_deadband(value):
+            self.temp_events_filtered += 1
+            return
+        self._post(ROLE_TEMP, value)
+
+    def _within_deadband(self, value: float) -> bool:
+        """Return True if value is not worth acting on.
+
+        The reference is the last accepted sample, so slow drift in steps
+        below the deadband still gets through once it adds up. A value that
+        crosses a hysteresis boundary is never filtered.
+        """
+        reference = self._mailbox.get(ROLE_TEMP, self._current_temp)
+        if reference is None:
+            return False
+        if value == reference:
+            return True
+        if abs(value - reference) >= self.deadband:
+            return False
+        if self._target_temp is None:
+            return True
+
+        low = self._target_temp - self.hysteresis
+        high = self._target_temp + self.hysteresis
+        return (value < low) == (reference < low) and (value > high) == (
+            reference > high
+        )
+
+    @property
+    def filter_hit_rate(self) -> float:
+        """Return the share of temperature events dropped by the deadband."""
+        if not self.temp_events:
+            return 0.0
+        return self.temp_events_filtered / self.temp_events
+
+    @callback
+    def _hum_update(self, st):
+        """Humidity has no effect on heat demand; take the display path."""
+        if not st or st.state in ("unknown", "unavailable"):
+            return
+        self.display_updates += 1
+        self._post(ROLE_HUMIDITY, st, display_only=True)
+
+    @callback
+    def _hw_target_update(self, st):
+        """Act on setpoint changes made outside Radiator Sync.
+
+        The thermostat echoing our latest command only updates the reported
+        setpoint; attribute updates that leave the setpoint as it was are
+        ignored. An echo of an older, superseded command drops the commands
+        sent before it and re-runs climate control for the room.
+        """
+        if not st or "temperature" not in st.attributes:
+            return
+        value = st.attributes["temperature"]
+        if value == self._reported_setpoint:
+            return
+
+        if self._is_in_flight(value):
+            if value != self._commanded_setpoint:
+                # Landed after a newer command; only the latest is still due
+                self._in_flight = {
+                    setpoint: deadline
+                    for setpoint, deadline in self._in_flight.items()
+                    if setpoint == self._commanded_setpoint
+                }
+                self._post(ROLE_TRV, value)
+                return
+            del self._in_flight[value]
+            self.echoes_suppressed += 1
+            self._update_reported_setpoint(value)
+            return
+
+        # Someone else changed the setpoint; earlier commands are superseded
+        self.external_changes += 1
+        self._in_flight.clear()
+        self._post(ROLE_TRV, value)
+
+    @callback
+    def _post(self, role: str, sample: Any, display_only: bool = False):
+        """Keep only the latest sample per role until the next drain."""
+        self.events_received += 1
+        if role in self._mailbox:
+            self.events_conflated += 1
+        self._mailbox[role] = sample
+        if display_only:
+            self.coordinator.async_schedule_display_update(self)
+        else:
+            self.coordinator.async_schedule_update(self)
+
+    @property
+    def subscription_count(self) -> int:
+        """Return the number of state subscriptions the room holds."""
+        return len(self._unsubs)
+
+    @property
+    def mailbox_depth(self) -> int:
+        """Return the number of samples waiting to be applied."""
+        return len(self._mailbox)
+
+    @callback
+    def drain_mailbox(self):
+        """Apply the latest pending temperature, humidity and TRV samples."""
+        if not self._mailbox:
+            return
+        mailbox = self._mailbox
+        self._mailbox = {}
+
+        if (value := mailbox.get(ROLE_TEMP)) is not None:
+            self._current_temp = value
+            self.invalidate_heat_demand()
+
+        if st := mailbox.get(ROLE_HUMIDITY):
+            try:
+                self._current_humidity = float(st.state)
+            except Exception as e:
+                _LOGGER.error(
+                    f"Radiator '{self.room_name}': invalid humidity state: {st.state}: {e}"
+                )
+
+        if (value := mailbox.get(ROLE_TRV)) is not None:
+            self._update_reported_setpoint(value)
@@ -1,12 +1,12 @@
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.components.select import SelectEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_PRESETS
+from .const import DOMAIN, GLOBAL_PRESET
 from .heater.entities import HeaterModeSelect
 from .coordinator import RadiatorSyncCoordinator
+from .entity import RadiatorSyncEntity
 
 
 async def async_setup_entry(
@@ -29,20 +29,23 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class GlobalPresetSelect(CoordinatorEntity[RadiatorSyncCoordinator], SelectEntity):
+class GlobalPresetSelect(RadiatorSyncEntity, SelectEntity):
     """Global aggregator for room presets."""
 
     _attr_translation_key = "global_preset"
 
     def __init__(self, coordinator: RadiatorSyncCoordinator):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=GLOBAL_PRESET)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_global_preset"
         self._attr_device_info = coordinator.heater.device_info()
+        self._preset_names: list[str] | None = None
         self._update_attr()
 
     def _update_attr(self):
-        presets = self.coordinator.entry.options.get(CONF_PRESETS, {})
-        self._attr_options = ["none"] + list(presets.keys())
+        preset_names = self.coordinator.preset_names
+        if preset_names is not self._preset_names:
+            self._preset_names = preset_names
+            self._attr_options = ["none"] + preset_names
 
         # Check if all rooms have the same preset
         rooms = list(self.coordinator.get_rooms())
@@ -56,22 +59,15 @@ class GlobalPresetSelect(CoordinatorEntity[RadiatorSyncCoordinator], SelectEntit
         else:
             self._attr_current_option = "none"
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._update_attr()
-        self.async_write_ha_state()
+    def _snapshot(self):
+        return (tuple(self._attr_options), self._attr_current_option)
 
     async def async_select_option(self, option: str) -> None:
         """Apply preset to all rooms."""
-        if option == "none":
-            # We don't have a way to 'unset' to none specifically other than manual temp change
-            # but we can just leave it. Or we could explicitly set _active_preset to None in rooms.
-            for room in self.coordinator.get_rooms():
-                room._active_preset = None
-                await room.notify()
-        else:
-            for room in self.coordinator.get_rooms():
-                await room.set_preset_mode(option)
+        # "none" only clears the active preset; targets are left untouched
+        await self.coordinator.async_set_preset_mode(
+            None if option == "none" else option
+        )
 
         self._update_attr()
-        self.async_write_ha_state()
+        self._async_write_if_changed()
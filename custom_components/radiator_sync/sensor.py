@@ -1,10 +1,20 @@
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN
-from .heater.entities import HeaterHeatDemand
-from .radiator.entities import RadiatorRoomHeatDemand
+from .const import DOMAIN, SIGNAL_ROOM_ADDED
+from .heater.entities import (
+    HeaterHeatDemand,
+    HeaterStorageWrites,
+    HeaterActuatorQueueDepth,
+    HeaterActuatorQueueWait,
+    HeaterActuatorCommandsDropped,
+    HeaterLoopBudgetViolations,
+    HeaterStageLatency,
+)
+from .radiator.entities import RadiatorRoomHeatDemand, RadiatorRoomSetpointCommands
+from .radiator.state_manager import RadiatorStateManager
 from .coordinator import RadiatorSyncCoordinator
 
 
@@ -25,9 +35,33 @@ async def async_setup_entry(
 
     entities: list[Entity] = [
         HeaterHeatDemand(heater_manager),
+        HeaterStorageWrites(heater_manager),
+        HeaterActuatorQueueDepth(heater_manager),
+        HeaterActuatorQueueWait(heater_manager),
+        HeaterActuatorCommandsDropped(heater_manager),
+        HeaterLoopBudgetViolations(heater_manager),
     ]
 
+    if (timings := coordinator.timings) is not None:
+        entities.extend(
+            HeaterStageLatency(heater_manager, stage, histogram)
+            for stage, histogram in timings.histograms.items()
+        )
+
     for room in coordinator.get_rooms():
         entities.append(RadiatorRoomHeatDemand(room))
+        entities.append(RadiatorRoomSetpointCommands(room))
 
     async_add_entities(entities)
+
+    @callback
+    def _room_added(room: RadiatorStateManager):
+        async_add_entities(
+            [RadiatorRoomHeatDemand(room), RadiatorRoomSetpointCommands(room)]
+        )
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ROOM_ADDED.format(entry.entry_id), _room_added
+        )
+    )
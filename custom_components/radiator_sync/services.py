@@ -0,0 +1,98 @@
+import asyncio
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+from .profiler import async_profile
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_GET_TRACE = "get_trace"
+SERVICE_PROFILE = "profile"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DURATION = "duration"
+
+DEFAULT_PROFILE_DURATION = 60
+
+GET_TRACE_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(  # type: ignore
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        )
+    }
+)
+
+
+def _coordinators(hass: HomeAssistant, call: ServiceCall) -> dict[str, Any]:
+    """Return coordinators of loaded entries, optionally just the requested one."""
+    entries = hass.data.get(DOMAIN, {})
+    if ATTR_CONFIG_ENTRY_ID not in call.data:
+        return {entry_id: data["coordinator"] for entry_id, data in entries.items()}
+
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    if entry_id not in entries:
+        raise ServiceValidationError(f"Radiator Sync entry {entry_id} is not loaded")
+    return {entry_id: entries[entry_id]["coordinator"]}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services once for all entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_GET_TRACE):
+        return
+
+    async def _async_get_trace(call: ServiceCall) -> ServiceResponse:
+        """Return recorded heater decisions and room commands."""
+        return {
+            "traces": {
+                entry_id: coordinator.trace.as_list()
+                for entry_id, coordinator in _coordinators(hass, call).items()
+            }
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TRACE,
+        _async_get_trace,
+        schema=GET_TRACE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    profile_lock = asyncio.Lock()
+
+    async def _async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the integration and write the results to the config dir."""
+        if profile_lock.locked():
+            raise ServiceValidationError("A Radiator Sync profile is already running")
+        async with profile_lock:
+            return await async_profile(hass, call.data[ATTR_DURATION])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove integration services once the last entry is unloaded."""
+    if hass.data.get(DOMAIN):
+        return
+
+    hass.services.async_remove(DOMAIN, SERVICE_GET_TRACE)
+    hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
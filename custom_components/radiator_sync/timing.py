@@ -0,0 +1,91 @@
+from bisect import bisect_left
+from functools import wraps
+from inspect import iscoroutinefunction
+from time import perf_counter
+
+STAGE_TEMP_UPDATE = "temp_update"
+STAGE_ORCHESTRATE = "orchestrate"
+STAGE_APPLY_HEAT_DEMAND = "apply_heat_demand"
+STAGE_PERSIST = "persist"
+STAGE_LISTENER_FANOUT = "listener_fanout"
+STAGE_SERVICE_CALL = "service_call"
+
+STAGES = (
+    STAGE_TEMP_UPDATE,
+    STAGE_ORCHESTRATE,
+    STAGE_APPLY_HEAT_DEMAND,
+    STAGE_PERSIST,
+    STAGE_LISTENER_FANOUT,
+    STAGE_SERVICE_CALL,
+)
+
+# Bucket upper bounds in seconds, four per doubling from 10 us to ~170 s
+BUCKET_BOUNDS = tuple(1e-5 * 2 ** (index / 4) for index in range(97))
+
+
+class LatencyHistogram:
+    """Fixed-memory latency histogram with logarithmic buckets."""
+
+    __slots__ = ("counts", "count", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent: float) -> float:
+        """Return the upper bound of the bucket holding the percentile."""
+        rank = percent / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                if index == len(BUCKET_BOUNDS):
+                    return self.max
+                return min(BUCKET_BOUNDS[index], self.max)
+        return 0.0
+
+
+class StageTimings:
+    """Latency histograms for the hot-path stages.
+
+    Methods are instrumented by replacing them on the instance, so nothing
+    is measured, and nothing costs anything, unless timings are enabled.
+    """
+
+    def __init__(self) -> None:
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES}
+
+    def instrument(self, obj: object, name: str, stage: str) -> None:
+        """Time every call of obj.name into the histogram of stage."""
+        func = getattr(obj, name)
+        histogram = self.histograms[stage]
+
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def timed_async(*args, **kwargs):
+                start = perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    histogram.record(perf_counter() - start)
+
+            setattr(obj, name, timed_async)
+        else:
+
+            @wraps(func)
+            def timed_sync(*args, **kwargs):
+                start = perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    histogram.record(perf_counter() - start)
+
+            setattr(obj, name, timed_sync)
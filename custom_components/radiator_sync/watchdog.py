@@ -0,0 +1,107 @@
+from time import monotonic, perf_counter
+from typing import Callable, Optional
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+STAGE_CLIMATE_CONTROL = "climate_control"
+
+# Violations are logged at most once per interval, summarizing the rest
+LOG_INTERVAL = 300
+
+# Coalescing window used once strict mode has tripped
+DEGRADED_COALESCE_FACTOR = 4
+DEGRADED_MIN_COALESCE_WINDOW = 1.0
+
+
+class BudgetChain:
+    """Wall time of one chain of coordinator work, split into stages."""
+
+    __slots__ = ("_watchdog", "_started", "_lap", "stage", "room", "slowest")
+
+    def __init__(self, watchdog: "LoopBudgetWatchdog") -> None:
+        self._watchdog = watchdog
+        self._started = self._lap = perf_counter()
+        self.stage: Optional[str] = None
+        self.room: Optional[str] = None
+        self.slowest = 0.0
+
+    def record(self, stage: str, room: Optional[str], elapsed: float) -> None:
+        """Attribute elapsed seconds to a stage, optionally of one room."""
+        if elapsed >= self.slowest:
+            self.stage = stage
+            self.room = room
+            self.slowest = elapsed
+
+    def lap(self, stage: str, room: Optional[str] = None) -> None:
+        """Attribute the time since the previous lap to a stage."""
+        now = perf_counter()
+        self.record(stage, room, now - self._lap)
+        self._lap = now
+
+    def finish(self) -> None:
+        self._watchdog.check(self, perf_counter() - self._started)
+
+
+class LoopBudgetWatchdog:
+    """Checks coordinator work on the event loop against a time budget.
+
+    A chain over budget is counted and attributed to its slowest stage.
+    In strict mode the first violation marks the coordinator degraded, so
+    it switches to a coarser coalescing window.
+    """
+
+    def __init__(
+        self,
+        budget: float,
+        strict: bool = False,
+        on_violation: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.budget = budget
+        self.strict = strict
+        self.degraded = False
+        self._on_violation = on_violation
+
+        self.violations = 0
+        self.worst = 0.0
+        self.last_stage: Optional[str] = None
+        self.last_room: Optional[str] = None
+        self._logged: Optional[float] = None
+        self._unlogged = 0
+
+    def start(self) -> BudgetChain:
+        return BudgetChain(self)
+
+    def check(self, chain: BudgetChain, elapsed: float) -> None:
+        if elapsed <= self.budget:
+            return
+
+        self.violations += 1
+        self.worst = max(self.worst, elapsed)
+        self.last_stage = chain.stage
+        self.last_room = chain.room
+
+        now = monotonic()
+        if self._logged is None or now - self._logged >= LOG_INTERVAL:
+            _LOGGER.warning(
+                "Coordinator work took %.1f ms, over the %.1f ms event loop "
+                "budget; slowest stage %s (room: %s), %s earlier violations "
+                "not logged",
+                elapsed * 1000,
+                self.budget * 1000,
+                chain.stage,
+                chain.room or "-",
+                self._unlogged,
+            )
+            self._logged = now
+            self._unlogged = 0
+        else:
+            self._unlogged += 1
+
+        if self.strict and not self.degraded:
+            _LOGGER.warning("Switching to a coarser coalescing window")
+            self.degraded = True
+
+        if self._on_violation is not None:
+            self._on_violation()
@@ -12,30 +12,52 @@ from custom_components.radiator_sync.const import (
 )
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmark",
+        action="store_true",
+        default=False,
+        help="Run the large-house coordinator benchmarks.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmark"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="needs --run-benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
     yield
 
 
+LIVING_ROOM = {
+    "Living Room": {
+        CONF_NAME: "Living Room",
+        CONF_SENSOR_TEMP: "sensor.living_room_temp",
+    }
+}
+
+HEATER_DATA = {
+    CONF_HEATER: "switch.test_heater",
+    "min_on_s": 300,
+    "min_off_s": 300,
+}
+
+
 @pytest.fixture
 def mock_config_entry():
     """Return a mock config entry."""
     return MockConfigEntry(
         domain=DOMAIN,
         title="RadiatorSync",
-        data={
-            CONF_HEATER: "switch.test_heater",
-            "min_on_s": 300,
-            "min_off_s": 300,
-        },
-        options={
-            CONF_ROOMS: {
-                "Living Room": {
-                    CONF_NAME: "Living Room",
-                    CONF_SENSOR_TEMP: "sensor.living_room_temp",
-                }
-            }
-        },
+        data=dict(HEATER_DATA),
+        options={CONF_ROOMS: LIVING_ROOM},
         entry_id="test_entry_id",
     )
 
@@ -56,3 +78,36 @@ async def setup_integration(hass, mock_config_entry):
     await hass.async_block_till_done()
 
     return mock_config_entry
+
+
+@pytest.fixture
+def setup_entry(hass):
+    """Return a factory that sets up an entry with the given rooms and options.
+
+    rooms defaults to the living room of mock_config_entry. states maps
+    entity ids to a state, or to a (state, attributes) tuple, and is applied
+    before setup; the heater switch starts off.
+    """
+
+    async def _setup_entry(entry_id, rooms=None, states=None, options=None):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data=dict(HEATER_DATA),
+            options={CONF_ROOMS: rooms or LIVING_ROOM, **(options or {})},
+            entry_id=entry_id,
+        )
+        entry.add_to_hass(hass)
+        await async_setup_component(hass, "switch", {})
+
+        hass.states.async_set("switch.test_heater", "off")
+        for entity_id, state in (states or {}).items():
+            if isinstance(state, tuple):
+                hass.states.async_set(entity_id, *state)
+            else:
+                hass.states.async_set(entity_id, state)
+
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        return entry
+
+    return _setup_entry
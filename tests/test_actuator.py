@@ -0,0 +1,130 @@
+"""Test the Radiator Sync actuator queue."""
+
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    async_mock_service,
+)
+
+from custom_components.radiator_sync.actuator import (
+    ActuatorQueue,
+    PRIORITY_HEATER,
+    PRIORITY_FAR_BELOW_TARGET,
+    PRIORITY_NEAR_TARGET,
+)
+
+
+async def test_queue_is_rate_limited_and_prioritized(hass, freezer):
+    """Test token bucket, priorities and replacement of queued commands."""
+    set_temperature = async_mock_service(hass, "climate", "set_temperature")
+    turn_on = async_mock_service(hass, "switch", "turn_on")
+    queue = ActuatorQueue(hass, rate=2)
+
+    queue.async_enqueue(
+        "climate",
+        "set_temperature",
+        "climate.a",
+        {"temperature": 30.0},
+        PRIORITY_NEAR_TARGET,
+    )
+    queue.async_enqueue(
+        "climate",
+        "set_temperature",
+        "climate.b",
+        {"temperature": 25.0},
+        PRIORITY_FAR_BELOW_TARGET,
+    )
+    queue.async_enqueue(
+        "climate",
+        "set_temperature",
+        "climate.b",
+        {"temperature": 30.0},
+        PRIORITY_FAR_BELOW_TARGET,
+    )
+    queue.async_enqueue(
+        "climate",
+        "set_temperature",
+        "climate.c",
+        {"temperature": 20.0},
+        PRIORITY_FAR_BELOW_TARGET,
+    )
+    assert queue.depth == 3
+    assert queue.commands_dropped == 1
+
+    # The heater jumps the queue and takes one of the two tokens
+    queue.async_enqueue("switch", "turn_on", "switch.heater", {}, PRIORITY_HEATER)
+    await hass.async_block_till_done()
+    assert len(turn_on) == 1
+    assert [call.data for call in set_temperature] == [
+        {"entity_id": ["climate.b"], "temperature": 30.0}
+    ]
+    assert queue.depth == 2
+
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert [call.data for call in set_temperature[1:]] == [
+        {"entity_id": ["climate.c"], "temperature": 20.0},
+        {"entity_id": ["climate.a"], "temperature": 30.0},
+    ]
+    assert queue.depth == 0
+    assert queue.commands_sent == 4
+
+
+async def test_flush_drops_rate_limited_commands(hass):
+    """Test that a flush sends what the rate allows and leaves no timer."""
+    set_temperature = async_mock_service(hass, "climate", "set_temperature")
+    queue = ActuatorQueue(hass, rate=1)
+
+    for index in range(10):
+        queue.async_enqueue(
+            "climate",
+            "set_temperature",
+            f"climate.room_{index}",
+            {"temperature": 18.0 + index},
+            PRIORITY_NEAR_TARGET,
+        )
+    await queue.async_flush()
+    await hass.async_block_till_done()
+
+    assert queue.depth == 0
+    assert queue.commands_sent == 1
+    assert queue.commands_dropped == 9
+    assert len(set_temperature) == 1
+    assert queue._unsub_dispatch is None
+
+
+async def test_on_sent_runs_when_the_command_is_sent(hass, freezer):
+    """Test that on_sent waits for a token and skips replaced commands."""
+    async_mock_service(hass, "climate", "set_temperature")
+    queue = ActuatorQueue(hass, rate=1)
+    sent = []
+
+    for entity_id, value in (("climate.a", 20.0), ("climate.b", 21.0)):
+        queue.async_enqueue(
+            "climate",
+            "set_temperature",
+            entity_id,
+            {"temperature": value},
+            PRIORITY_NEAR_TARGET,
+            lambda value=value: sent.append(value),
+        )
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert sent == [20.0]
+
+    # Replacing the held command discards its callback
+    queue.async_enqueue(
+        "climate",
+        "set_temperature",
+        "climate.b",
+        {"temperature": 22.0},
+        PRIORITY_NEAR_TARGET,
+        lambda: sent.append(22.0),
+    )
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert sent == [20.0, 22.0]
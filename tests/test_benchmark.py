@@ -0,0 +1,86 @@
+"""Synthetic large-house benchmarks for the Radiator Sync coordinator.
+
+Skipped by default, run with ``pytest tests/test_benchmark.py --run-benchmark -s``.
+"""
+
+import random
+import time
+from datetime import timedelta
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+)
+
+from custom_components.radiator_sync.const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_SENSOR_TEMP,
+    CONF_ROOM_CLIMATE,
+)
+
+EVENTS_PER_ROOM = 5
+
+
+async def _setup_house(hass, setup_entry, room_count):
+    rooms = {
+        f"Room {index}": {
+            CONF_NAME: f"Room {index}",
+            CONF_SENSOR_TEMP: f"sensor.room_{index}_temp",
+            CONF_ROOM_CLIMATE: f"climate.room_{index}_trv",
+        }
+        for index in range(room_count)
+    }
+    states = {}
+    for index in range(room_count):
+        states[f"sensor.room_{index}_temp"] = "21.0"
+        states[f"climate.room_{index}_trv"] = (
+            "heat",
+            {"temperature": 21.0, "min_temp": 5.0, "max_temp": 30.0},
+        )
+
+    entry = await setup_entry(f"bench_{room_count}", rooms, states=states)
+    return hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("room_count", [10, 100, 1000])
+async def test_event_storm(hass, setup_entry, room_count, capsys):
+    """Drive a temperature event storm through every room."""
+    coordinator = await _setup_house(hass, setup_entry, room_count)
+    rng = random.Random(room_count)
+
+    actuators = coordinator.actuators
+    passes = coordinator.orchestration_count
+    await coordinator.persistence.async_flush()
+    await actuators.async_flush()
+    saves = coordinator.persistence.save_count
+    commands = actuators.commands_sent
+    service_calls = actuators.service_calls
+
+    events = room_count * EVENTS_PER_ROOM
+    started = time.perf_counter()
+    for step in range(EVENTS_PER_ROOM):
+        for index in range(room_count):
+            value = 19.0 + rng.random() * 4.0
+            hass.states.async_set(f"sensor.room_{index}_temp", f"{value:.2f}")
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=step + 1))
+        await hass.async_block_till_done()
+    elapsed = time.perf_counter() - started
+    # Unloading flushes runtime state and drops commands still rate limited
+    assert await hass.config_entries.async_unload(f"bench_{room_count}")
+
+    with capsys.disabled():
+        print(
+            f"\n[{room_count} rooms] {events} events in {elapsed:.3f}s: "
+            f"{events / elapsed:.0f} events/s, "
+            f"{elapsed / events * 1e6:.0f} us loop time/event, "
+            f"{coordinator.orchestration_count - passes} orchestration passes, "
+            f"{coordinator.persistence.save_count - saves} store saves, "
+            f"{actuators.commands_sent - commands} commands in "
+            f"{actuators.service_calls - service_calls} service calls"
+        )
+
+    assert coordinator.orchestration_count - passes <= EVENTS_PER_ROOM * 2
@@ -1,6 +1,48 @@
 """Test the Radiator Sync climate."""
 
+from datetime import timedelta
+
 from homeassistant.components.climate.const import HVACMode
+from homeassistant.const import ATTR_SERVICE, ATTR_SERVICE_DATA, EVENT_CALL_SERVICE
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    async_mock_service,
+)
+
+from custom_components.radiator_sync.const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_SENSOR_TEMP,
+    CONF_ROOM_CLIMATE,
+    CONF_ADVANCED,
+    CONF_MAX_COMMANDS_PER_SECOND,
+)
+from custom_components.radiator_sync.radiator.state_manager import (
+    COMMAND_ECHO_TIMEOUT,
+)
+
+BEDROOM = {
+    "Bedroom": {
+        CONF_NAME: "Bedroom",
+        CONF_SENSOR_TEMP: "sensor.bedroom_temp",
+        CONF_ROOM_CLIMATE: "climate.bedroom_trv",
+    }
+}
+
+
+def _record_setpoints(hass):
+    """Record set_temperature data, including commands sent during setup."""
+    calls = []
+
+    @callback
+    def _service_called(event):
+        if event.data[ATTR_SERVICE] == "set_temperature":
+            calls.append(event.data[ATTR_SERVICE_DATA])
+
+    hass.bus.async_listen(EVENT_CALL_SERVICE, _service_called)
+    return calls
 
 
 async def test_climate(hass, setup_integration):
@@ -25,3 +67,245 @@ async def test_climate(hass, setup_integration):
 
     state = hass.states.get("climate.living_room_radiator")
     assert state.attributes.get("temperature") == 22.0
+
+
+async def test_setpoint_commands_are_deduplicated(hass, setup_entry):
+    """Test that repeated identical setpoints are not sent to the thermostat."""
+    entry = await setup_entry(
+        "dedup_entry_id",
+        BEDROOM,
+        states={
+            "sensor.bedroom_temp": "19.0",
+            "climate.bedroom_trv": (
+                "heat",
+                {"temperature": 21.0, "min_temp": 5.0, "max_temp": 30.0},
+            ),
+        },
+    )
+
+    room = hass.data[DOMAIN][entry.entry_id]["coordinator"].rooms["Bedroom"]
+    assert room.commands_issued == 1
+    assert room.last_command() == 30.0
+
+    # Send the batched startup command, then mock: the climate platform
+    # registers the real service during setup
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    calls = async_mock_service(hass, "climate", "set_temperature")
+
+    async def _report_temperature(value):
+        hass.states.async_set("sensor.bedroom_temp", value)
+        await hass.async_block_till_done()
+        # Coalesced room pass, then the batched setpoint commands
+        for _ in range(2):
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+            await hass.async_block_till_done()
+
+    # Further cold readings while the command is in flight are suppressed
+    for value in ("18.9", "18.8", "18.7"):
+        await _report_temperature(value)
+    assert len(calls) == 0
+
+    # Thermostat confirms the setpoint; still nothing to send
+    hass.states.async_set(
+        "climate.bedroom_trv",
+        "heat",
+        {"temperature": 30.0, "min_temp": 5.0, "max_temp": 30.0},
+    )
+    await _report_temperature("18.6")
+    assert len(calls) == 0
+    assert room.echoes_suppressed == 1
+    assert room.external_changes == 0
+
+    # Someone turns the knob; the next cold reading restores the setpoint
+    hass.states.async_set(
+        "climate.bedroom_trv",
+        "heat",
+        {"temperature": 20.0, "min_temp": 5.0, "max_temp": 30.0},
+    )
+    await _report_temperature("18.5")
+    assert len(calls) == 1
+    assert calls[0].data["temperature"] == 30.0
+    assert room.commands_issued == 2
+    assert room.commands_suppressed >= 4
+    assert room.external_changes == 1
+
+
+async def test_restored_setpoint_is_sent_while_lower_one_is_in_flight(
+    hass, setup_entry
+):
+    """Test that a setpoint equal to the stale reported one is still sent."""
+    entry = await setup_entry(
+        "restore_entry_id",
+        BEDROOM,
+        states={
+            "sensor.bedroom_temp": "19.0",
+            "climate.bedroom_trv": (
+                "heat",
+                {"temperature": 30.0, "min_temp": 5.0, "max_temp": 30.0},
+            ),
+        },
+    )
+    room = hass.data[DOMAIN][entry.entry_id]["coordinator"].rooms["Bedroom"]
+    calls = async_mock_service(hass, "climate", "set_temperature")
+
+    async def _set_target(value):
+        await room.set_target_temperature(value)
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    # Lower the target, then restore it before the thermostat reports 5
+    await _set_target(17.0)
+    await _set_target(22.0)
+    assert [call.data["temperature"] for call in calls] == [5.0, 30.0]
+
+    # The echo of 5 lands; 30 is still expected
+    hass.states.async_set(
+        "climate.bedroom_trv",
+        "heat",
+        {"temperature": 5.0, "min_temp": 5.0, "max_temp": 30.0},
+    )
+    await hass.async_block_till_done()
+    assert room.last_command() == 30.0
+
+
+async def test_superseded_echo_restores_latest_setpoint(hass, setup_entry):
+    """Test that an older command echoed last is corrected."""
+    calls = _record_setpoints(hass)
+    entry = await setup_entry(
+        "superseded_entry_id",
+        BEDROOM,
+        states={
+            "sensor.bedroom_temp": "19.0",
+            "climate.bedroom_trv": (
+                "heat",
+                {"temperature": 17.0, "min_temp": 5.0, "max_temp": 30.0},
+            ),
+        },
+    )
+    room = hass.data[DOMAIN][entry.entry_id]["coordinator"].rooms["Bedroom"]
+
+    async def _settle():
+        # Coalesced room pass, then the batched setpoint commands
+        for _ in range(2):
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+            await hass.async_block_till_done()
+
+    async def _report_setpoint(value):
+        hass.states.async_set(
+            "climate.bedroom_trv",
+            "heat",
+            {"temperature": value, "min_temp": 5.0, "max_temp": 30.0},
+        )
+        await hass.async_block_till_done()
+        await _settle()
+
+    # Startup lowers the thermostat to 5, then the target is raised
+    await _settle()
+    await room.set_target_temperature(22.0)
+    await _settle()
+    assert [data["temperature"] for data in calls] == [5.0, 30.0]
+
+    # The thermostat applies both, but reports them out of order
+    await _report_setpoint(30.0)
+    await _report_setpoint(5.0)
+    assert [data["temperature"] for data in calls] == [5.0, 30.0, 30.0]
+    assert room.echoes_suppressed == 1
+    assert room.external_changes == 0
+
+
+async def test_queued_setpoint_is_not_reissued(hass, setup_entry):
+    """Test that a setpoint waiting on the actuator queue is not queued again."""
+    entry = await setup_entry(
+        "queued_entry_id",
+        BEDROOM,
+        states={
+            "sensor.bedroom_temp": "19.0",
+            "climate.bedroom_trv": (
+                "heat",
+                {"temperature": 21.0, "min_temp": 5.0, "max_temp": 30.0},
+            ),
+        },
+    )
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    room = coordinator.rooms["Bedroom"]
+
+    suppressed = room.commands_suppressed
+
+    # Lowering the target queues 5 for the next batch, twice over
+    await room.set_target_temperature(17.0)
+    await room.set_target_temperature(16.0)
+    assert coordinator.actuators.depth == 1
+    assert room.commands_issued == 2
+    assert room.commands_suppressed > suppressed
+    assert coordinator.actuators.commands_dropped == 0
+
+
+async def test_echo_deadline_starts_when_the_command_is_sent(
+    hass, setup_entry, freezer
+):
+    """Test that a command held on the queue still expects its echo."""
+    calls = _record_setpoints(hass)
+    entry = await setup_entry(
+        "held_entry_id",
+        BEDROOM,
+        states={
+            "sensor.bedroom_temp": "19.0",
+            "climate.bedroom_trv": (
+                "heat",
+                {"temperature": 21.0, "min_temp": 5.0, "max_temp": 30.0},
+            ),
+        },
+    )
+    room = hass.data[DOMAIN][entry.entry_id]["coordinator"].rooms["Bedroom"]
+    assert [data["temperature"] for data in calls] == [30.0]
+
+    # The queued command is sent only after the echo timeout has passed
+    await room.set_target_temperature(17.0)
+    freezer.tick(timedelta(seconds=COMMAND_ECHO_TIMEOUT + 10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert [data["temperature"] for data in calls] == [30.0, 5.0]
+
+    hass.states.async_set(
+        "climate.bedroom_trv",
+        "heat",
+        {"temperature": 5.0, "min_temp": 5.0, "max_temp": 30.0},
+    )
+    await hass.async_block_till_done()
+    assert room.echoes_suppressed == 1
+    assert room.external_changes == 0
+
+
+async def test_setpoint_commands_are_grouped(hass, setup_entry):
+    """Test that rooms commanded to the same setpoint share one service call."""
+    rooms = {
+        f"Room {index}": {
+            CONF_NAME: f"Room {index}",
+            CONF_SENSOR_TEMP: f"sensor.room_{index}_temp",
+            CONF_ROOM_CLIMATE: f"climate.room_{index}_trv",
+        }
+        for index in range(5)
+    }
+    states = {}
+    for index in range(5):
+        states[f"sensor.room_{index}_temp"] = "18.0"
+        states[f"climate.room_{index}_trv"] = (
+            "heat",
+            {"temperature": 21.0, "min_temp": 5.0, "max_temp": 28.0 if index else 30.0},
+        )
+    # Startup commands are sent during setup, before a mock could be added
+    calls = _record_setpoints(hass)
+    await setup_entry(
+        "grouped_entry_id",
+        rooms,
+        states=states,
+        options={CONF_ADVANCED: {CONF_MAX_COMMANDS_PER_SECOND: 10}},
+    )
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert sorted((data["temperature"], len(data["entity_id"])) for data in calls) == [
+        (28.0, 4),
+        (30.0, 1),
+    ]
@@ -0,0 +1,233 @@
+"""Test the Radiator Sync coordinator."""
+
+from datetime import timedelta
+
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    async_mock_service,
+)
+
+from custom_components.radiator_sync.const import (
+    DOMAIN,
+    CONF_ROOMS,
+    CONF_NAME,
+    CONF_SENSOR_TEMP,
+    CONF_DEADBAND,
+)
+
+
+async def test_event_burst_is_coalesced(hass, setup_integration):
+    """Test that a burst of sensor events results in one orchestration pass."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]["coordinator"]
+    passes = coordinator.orchestration_count
+
+    for value in range(1, 10):
+        hass.states.async_set("sensor.living_room_temp", f"{20.0 + value / 1000:.3f}")
+    await hass.async_block_till_done()
+
+    # Nothing runs before the coalescing window elapses; only the latest
+    # sample waits in the room mailbox
+    assert coordinator.orchestration_count == passes
+    assert coordinator.mailbox_backlog == 1
+    assert coordinator.events_conflated == 8
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert coordinator.orchestration_count == passes + 1
+    assert coordinator.mailbox_backlog == 0
+    room = next(iter(coordinator.get_rooms()))
+    assert room.current_temperature() == 20.009
+
+
+async def test_heat_demand_recompute_corrects_drift(hass, setup_integration):
+    """Test that the periodic full recompute repairs the running aggregate."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]["coordinator"]
+    assert coordinator.heater.heat_demand == 50
+
+    coordinator._total_heat_demand = 80
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=16))
+    await hass.async_block_till_done()
+
+    assert coordinator._total_heat_demand == 50
+    assert coordinator.heater.heat_demand == 50
+
+
+async def test_updates_are_targeted(hass, setup_integration):
+    """Test that only listeners subscribed to the changed room are updated."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]["coordinator"]
+    room = next(iter(coordinator.get_rooms()))
+    updated = []
+
+    coordinator.async_add_listener(lambda: updated.append("room"), context=room)
+    coordinator.async_add_listener(
+        lambda: updated.append("heater"), context=coordinator.heater
+    )
+    coordinator.async_add_listener(
+        lambda: updated.append("other"), context="other_room"
+    )
+
+    # Demand stays at 50%, so the heater entities have nothing to refresh
+    hass.states.async_set("sensor.living_room_temp", "20.005")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert updated == ["room"]
+
+    updated.clear()
+    hass.states.async_set("sensor.living_room_temp", "19.0")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert sorted(updated) == ["heater", "room"]
+
+
+async def test_overlapping_events_orchestrate_once(hass, setup_integration):
+    """Test that overlapping sensor and switch events share one pass."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]["coordinator"]
+    turn_on = async_mock_service(hass, "switch", "turn_on")
+    turn_off = async_mock_service(hass, "switch", "turn_off")
+    passes = coordinator.orchestration_count
+
+    # Readings arrive while the switch reports the startup command applied
+    hass.states.async_set("sensor.living_room_temp", "19.5")
+    hass.states.async_set("switch.test_heater", STATE_ON)
+    hass.states.async_set("sensor.living_room_temp", "19.0")
+    hass.states.async_set("sensor.living_room_temp", "18.5")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert coordinator.orchestration_count == passes + 1
+    assert coordinator.heater.heat_demand == 100
+    assert coordinator.heater.is_running
+    assert len(turn_on) == len(turn_off) == 0
+
+    # The switch drops out mid-burst; demand turns it back on exactly once
+    coordinator.heater.min_off_seconds = 0
+    hass.states.async_set("switch.test_heater", STATE_OFF)
+    hass.states.async_set("sensor.living_room_temp", "18.0")
+    hass.states.async_set("sensor.living_room_temp", "17.5")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    assert coordinator.orchestration_count == passes + 2
+    assert len(turn_on) == 1
+    assert len(turn_off) == 0
+
+
+async def test_shared_sensor_is_tracked_once(hass, setup_integration):
+    """Test that one subscription dispatches a shared sensor to every room."""
+    entry = setup_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    assert coordinator.tracked_entity_count == 2  # heater + temperature sensor
+
+    rooms = {
+        **entry.options[CONF_ROOMS],
+        "Hall": {
+            "room_name": "Hall",
+            "temperature_sensor": "sensor.living_room_temp",
+        },
+    }
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_ROOMS: rooms}
+    )
+    await hass.async_block_till_done()
+
+    assert coordinator.tracked_entity_count == 2
+    assert coordinator.subscription_count == 3
+
+    hass.states.async_set("sensor.living_room_temp", "18.5")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert [room.current_temperature() for room in coordinator.get_rooms()] == [
+        18.5,
+        18.5,
+    ]
+
+
+async def test_temperature_deadband(hass, setup_integration):
+    """Test that jitter is filtered unless it crosses a hysteresis boundary."""
+    entry = setup_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    rooms = {
+        "Living Room": {
+            **entry.options[CONF_ROOMS]["Living Room"],
+            CONF_DEADBAND: 0.2,
+        }
+    }
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_ROOMS: rooms}
+    )
+    await hass.async_block_till_done()
+    room = coordinator.rooms["Living Room"]
+
+    # Target 21.0, hysteresis 0.3: the lower boundary is at 20.7
+    for value in ("20.0", "20.1", "20.3", "20.45", "20.6", "20.75"):
+        hass.states.async_set("sensor.living_room_temp", value)
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    # 20.1 and 20.45 stay inside the deadband; 20.75 crosses the boundary
+    assert room.temp_events == 5
+    assert room.temp_events_filtered == 2
+    assert room.current_temperature() == 20.75
+    assert coordinator.filter_hit_rate == 0.4
+
+
+async def test_humidity_only_refreshes_climate(hass, setup_integration):
+    """Test that humidity updates skip orchestration and thermostat control."""
+    entry = setup_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    rooms = {
+        "Living Room": {
+            **entry.options[CONF_ROOMS]["Living Room"],
+            "humidity_sensor": "sensor.living_room_hum",
+        }
+    }
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_ROOMS: rooms}
+    )
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    passes = coordinator.orchestration_count
+    room = coordinator.rooms["Living Room"]
+    received = room.events_received
+
+    hass.states.async_set("sensor.living_room_hum", "54")
+    hass.states.async_set("sensor.living_room_hum", "55")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert coordinator.orchestration_count == passes
+    assert room.events_received == received + 2
+    assert room.events_conflated == 1
+    state = hass.states.get("climate.living_room_radiator")
+    assert state.attributes["current_humidity"] == 55
+
+
+async def test_startup_orchestrates_once(hass, setup_entry):
+    """Test that rooms are read and orchestrated in one startup pass."""
+    rooms = {
+        f"Room {i}": {
+            CONF_NAME: f"Room {i}",
+            CONF_SENSOR_TEMP: f"sensor.room_{i}_temp",
+        }
+        for i in range(20)
+    }
+    entry = await setup_entry(
+        "startup_entry_id",
+        rooms,
+        states={f"sensor.room_{i}_temp": "20.0" for i in range(20)},
+    )
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    assert coordinator.orchestration_count == 1
+    assert coordinator.heater.heat_demand == 20 * 50
@@ -0,0 +1,48 @@
+"""Test the Radiator Sync diagnostics."""
+
+from homeassistant.helpers.json import json_dumps
+
+from custom_components.radiator_sync.const import DOMAIN
+from custom_components.radiator_sync.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+async def test_config_entry_diagnostics(hass, setup_integration):
+    """Test the diagnostics snapshot of the coordinator."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]["coordinator"]
+    diagnostics = await async_get_config_entry_diagnostics(hass, setup_integration)
+
+    room = diagnostics["rooms"]["Living Room"]
+    assert room["current_temperature"] == 20.0
+    assert room["target_temperature"] == 21.0
+    assert room["heat_demand"] == 50
+    assert room["preset_mode"] is None
+
+    assert room["reported_setpoint"] is None
+    assert room["subscriptions"] == 1
+
+    heater = diagnostics["heater"]
+    assert heater["override_mode"] == "auto"
+    assert heater["pending_command"] == "turn_on"
+    assert heater["retry_scheduled"] is False
+
+    assert diagnostics["coordinator"]["total_heat_demand"] == 50
+    assert diagnostics["coordinator"]["listeners"] > 0
+    assert diagnostics["coordinator"]["tracked_entities"] == 2
+    assert diagnostics["persistence"]["pending"] >= 0
+    assert diagnostics["timings"] is None
+
+    # Entity writes from startup, then a refresh that changes nothing
+    demand = "sensor.living_room_heat_demand"
+    writes = diagnostics["entities"][demand]
+    coordinator.async_publish(coordinator.rooms["Living Room"])
+    await coordinator.async_refresh_entities()
+    diagnostics = await async_get_config_entry_diagnostics(hass, setup_integration)
+    assert diagnostics["entities"][demand] == {
+        "writes_performed": writes["writes_performed"],
+        "writes_skipped": writes["writes_skipped"] + 1,
+    }
+
+    # Must be serializable as-is
+    json_dumps(diagnostics)
@@ -0,0 +1,73 @@
+"""Test the Radiator Sync heater control."""
+
+from datetime import timedelta
+
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    async_mock_service,
+)
+
+from custom_components.radiator_sync.const import DOMAIN
+
+
+async def test_restored_demand_is_decided_at_startup(
+    hass, mock_config_entry, hass_storage
+):
+    """Test that the heater switches on when restored demand is unchanged."""
+    hass_storage[f"{DOMAIN}.runtime_state_{mock_config_entry.entry_id}"] = {
+        "version": 1,
+        "data": {
+            "heater": {
+                "is_running": False,
+                "heat_demand": 50,
+                "threshold_heat_demand": 10.0,
+            }
+        },
+    }
+    await async_setup_component(hass, "switch", {})
+    turn_on = async_mock_service(hass, "switch", "turn_on")
+    mock_config_entry.add_to_hass(hass)
+    hass.states.async_set("switch.test_heater", STATE_OFF)
+    # Living room at 20.0 against 21.0 computes the same 50% demand
+    hass.states.async_set("sensor.living_room_temp", "20.0")
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+    assert coordinator.heater.heat_demand == 50
+    assert len(turn_on) == 1
+
+
+async def test_demand_during_min_off_is_retried(hass, setup_integration, freezer):
+    """Test that demand blocked by min_off switches the heater once it ends."""
+    turn_on = async_mock_service(hass, "switch", "turn_on")
+
+    # Heater ran and has just been switched off
+    hass.states.async_set("switch.test_heater", STATE_ON)
+    await hass.async_block_till_done()
+    hass.states.async_set("switch.test_heater", STATE_OFF)
+    await hass.async_block_till_done()
+    assert len(turn_on) == 0
+
+    # Room gets colder while the heater is in its min_off window
+    hass.states.async_set("sensor.living_room_temp", "19.5")
+    await hass.async_block_till_done()
+    freezer.tick(timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(turn_on) == 0
+
+    freezer.tick(timedelta(seconds=150))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(turn_on) == 0
+
+    # min_off is 300 s in the fixture
+    freezer.tick(timedelta(seconds=150))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(turn_on) == 1
+    assert turn_on[0].data["entity_id"] == ["switch.test_heater"]
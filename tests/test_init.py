@@ -1,7 +1,8 @@
 """Test Radiator Sync initialization."""
 
 from homeassistant.core import HomeAssistant
-from custom_components.radiator_sync.const import DOMAIN
+from homeassistant.setup import async_setup_component
+from custom_components.radiator_sync.const import DOMAIN, CONF_ROOMS
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 
@@ -17,8 +18,50 @@ async def test_setup_entry(hass: HomeAssistant):
         title="Radiator Sync",
     )
     entry.add_to_hass(hass)
+    # The heater gets its startup decision through the switch services
+    await async_setup_component(hass, "switch", {})
 
     assert await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
     assert DOMAIN in hass.data
+
+
+async def test_options_update_is_incremental(hass: HomeAssistant, setup_integration):
+    """Test that an options update only touches the rooms that changed."""
+    entry = setup_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    living_room = coordinator.rooms["Living Room"]
+    living_room._current_temp = 19.5
+    hass.states.async_set("sensor.kitchen_temp", "18.0")
+
+    rooms = {
+        **entry.options[CONF_ROOMS],
+        "Kitchen": {
+            "room_name": "Kitchen",
+            "temperature_sensor": "sensor.kitchen_temp",
+        },
+    }
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_ROOMS: rooms}
+    )
+    await hass.async_block_till_done()
+
+    # No reload: the untouched room keeps its manager and in-memory state
+    assert hass.data[DOMAIN][entry.entry_id]["coordinator"] is coordinator
+    assert coordinator.rooms["Living Room"] is living_room
+    assert living_room.current_temperature() == 19.5
+
+    kitchen = coordinator.rooms["Kitchen"]
+    assert kitchen.current_temperature() == 18.0
+    assert hass.states.get("climate.kitchen_radiator") is not None
+
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_ROOMS: {"Kitchen": rooms["Kitchen"]}}
+    )
+    await hass.async_block_till_done()
+
+    assert list(coordinator.rooms) == ["Kitchen"]
+    assert coordinator.rooms["Kitchen"] is kitchen
+    assert hass.states.get("climate.living_room_radiator") is None
+    assert coordinator._total_heat_demand == kitchen.get_heat_demand()
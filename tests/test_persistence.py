@@ -0,0 +1,67 @@
+"""Test the Radiator Sync runtime state persistence."""
+
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.radiator_sync.const import DOMAIN
+
+
+async def _set_temperature(hass, value):
+    await hass.services.async_call(
+        "climate",
+        "set_temperature",
+        {"entity_id": "climate.living_room_radiator", "temperature": value},
+        blocking=True,
+    )
+
+
+async def test_saves_are_coalesced(hass, setup_integration, hass_storage):
+    """Test that several changes within the save window produce one write."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]["coordinator"]
+    persistence = coordinator.persistence
+    saves = persistence.save_count
+
+    for value in (21.5, 22.0, 22.5):
+        await _set_temperature(hass, value)
+    await hass.async_block_till_done()
+    assert persistence.save_count == saves
+    assert persistence.pending > 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=2))
+    await hass.async_block_till_done()
+
+    assert persistence.save_count == saves + 1
+    assert persistence.pending == 0
+    assert persistence.bytes_written > 0
+
+    stored = hass_storage[f"{DOMAIN}.runtime_state_{setup_integration.entry_id}"]
+    assert stored["data"]["room_Living Room"]["target_temp"] == 22.5
+
+
+async def test_write_budget_defers_save(hass, setup_integration):
+    """Test that an exhausted write budget pushes the next save out."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]["coordinator"]
+    persistence = coordinator.persistence
+    persistence.max_writes_per_hour = 1
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=2))
+    await hass.async_block_till_done()
+    saves = persistence.save_count
+
+    await _set_temperature(hass, 22.0)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=4))
+    await hass.async_block_till_done()
+    assert persistence.save_count == saves
+    assert persistence.pending > 0
+
+
+async def test_unload_flushes_pending_state(hass, setup_integration, hass_storage):
+    """Test that unloading the entry writes pending state immediately."""
+    await _set_temperature(hass, 23.0)
+
+    assert await hass.config_entries.async_unload(setup_integration.entry_id)
+    await hass.async_block_till_done()
+
+    stored = hass_storage[f"{DOMAIN}.runtime_state_{setup_integration.entry_id}"]
+    assert stored["data"]["room_Living Room"]["target_temp"] == 23.0
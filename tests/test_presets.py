@@ -1,5 +1,12 @@
 """Test the Radiator Sync global presets."""
 
+from custom_components.radiator_sync.const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_SENSOR_TEMP,
+    CONF_PRESETS,
+)
+
 
 async def test_global_preset_aggregation(hass, setup_integration):
     """Test that global preset reflects room presets and vice versa."""
@@ -122,3 +129,79 @@ async def test_preset_room_override(hass, setup_integration):
     # Check that override was applied (22.5 instead of default 19.5)
     state = hass.states.get(living_room_entity)
     assert state.attributes.get("temperature") == 22.5
+
+
+async def test_global_preset_is_applied_in_one_pass(hass, setup_entry):
+    """Test that a global preset change orchestrates and persists once."""
+    rooms = {
+        f"Room {index}": {
+            CONF_NAME: f"Room {index}",
+            CONF_SENSOR_TEMP: f"sensor.room_{index}_temp",
+        }
+        for index in range(10)
+    }
+    entry = await setup_entry(
+        "bulk_entry_id",
+        rooms,
+        options={CONF_PRESETS: {"Night": {"default": 18.0, "overrides": {}}}},
+    )
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    passes = coordinator.orchestration_count
+    await coordinator.persistence.async_flush()
+    saves = coordinator.persistence.save_count
+
+    await hass.services.async_call(
+        "select",
+        "select_option",
+        {
+            "entity_id": "select.radiator_sync_bulk_entry_id_global_preset",
+            "option": "Night",
+        },
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    await coordinator.persistence.async_flush()
+
+    assert coordinator.orchestration_count == passes + 1
+    assert coordinator.persistence.save_count == saves + 1
+    for room in coordinator.get_rooms():
+        assert room.preset_mode == "Night"
+        assert room.target_temperature() == 18.0
+
+
+async def test_preset_table_is_cached(hass, setup_integration):
+    """Test that resolved presets are compiled once per options version."""
+    entry = setup_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    room = coordinator.rooms["Living Room"]
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={
+            **entry.options,
+            CONF_PRESETS: {
+                "Night": {"default": 19.5, "overrides": {"Living Room": 20.0}}
+            },
+        },
+    )
+    await hass.async_block_till_done()
+
+    presets = room.presets
+    assert presets == {"Night": 20.0}
+    assert room.presets is presets
+    assert room.preset_modes is room.preset_modes
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={
+            **entry.options,
+            CONF_PRESETS: {"Away": {"default": 15.0, "overrides": {}}},
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert room.presets == {"Away": 15.0}
+    assert room.preset_modes == ["Away"]
+    select = hass.states.get(f"select.radiator_sync_{entry.entry_id}_global_preset")
+    assert select.attributes["options"] == ["none", "Away"]
@@ -1,5 +1,12 @@
 """Test the Radiator Sync sensors."""
 
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.radiator_sync.const import DOMAIN
+
 
 async def test_sensors(hass, setup_integration):
     """Test sensor setup and state."""
@@ -16,3 +23,57 @@ async def test_sensors(hass, setup_integration):
     state = hass.states.get("sensor.living_room_heat_demand")
     assert state is not None
     assert state.state == "50"
+
+
+async def test_unchanged_state_is_not_written(hass, setup_integration):
+    """Test that refreshes without attribute changes skip the state write."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]["coordinator"]
+    sensor = next(
+        entity
+        for entity in coordinator.entities
+        if entity.entity_id == "sensor.living_room_heat_demand"
+    )
+    performed = sensor.writes_performed
+    skipped = sensor.writes_skipped
+
+    # Demand stays at 50%
+    hass.states.async_set("sensor.living_room_temp", "20.005")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert sensor.writes_performed == performed
+    assert sensor.writes_skipped == skipped + 1
+
+    hass.states.async_set("sensor.living_room_temp", "19.5")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    assert sensor.writes_performed == performed + 1
+    assert hass.states.get("sensor.living_room_heat_demand").state == "75"
+
+
+async def test_storage_writes_sensor(hass, setup_integration):
+    """Test that the storage writes sensor follows completed writes."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]["coordinator"]
+    assert coordinator.persistence.pending
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=2))
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.heater_runtime_state_writes")
+    assert int(state.state) == coordinator.persistence.save_count == 1
+    assert state.attributes["pending"] == 0
+
+
+async def test_actuator_queue_sensors(hass, setup_integration):
+    """Test the actuator queue diagnostic sensors."""
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.heater_command_queue_depth").state == "0"
+    assert (
+        hass.states.get("sensor.heater_commands_replaced").attributes["commands_sent"]
+        == 1
+    )  # the heater was switched on at startup
+    assert hass.states.get("sensor.heater_command_queue_wait") is not None
@@ -0,0 +1,111 @@
+"""Test the Radiator Sync services."""
+
+import asyncio
+import pstats
+import tracemalloc
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.radiator_sync.const import DOMAIN
+from custom_components.radiator_sync.decision_trace import DecisionTrace
+
+
+def test_trace_is_bounded():
+    """Test that the ring buffer keeps only the newest records."""
+    trace = DecisionTrace(size=3)
+    for index in range(5):
+        trace.record("room", "Bedroom", index, "below_band", current=18.0)
+
+    assert [record["result"] for record in trace.as_list()] == [2, 3, 4]
+    assert trace.recorded == 5
+
+
+async def test_get_trace(hass, setup_integration):
+    """Test that heater decisions are returned by the get_trace service."""
+    entry_id = setup_integration.entry_id
+    coordinator = hass.data[DOMAIN][entry_id]["coordinator"]
+    coordinator.heater.threshold_heat_demand = 10.0
+
+    # Demand drops to zero, but the heater is within its min_on window
+    hass.states.async_set("switch.test_heater", "on")
+    hass.states.async_set("sensor.living_room_temp", "22.0")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_trace",
+        {"config_entry_id": entry_id},
+        blocking=True,
+        return_response=True,
+    )
+    trace = response["traces"][entry_id]
+    assert [(record["result"], record["reason"]) for record in trace] == [
+        ("turn_on", "demand"),
+        ("blocked", "min_on"),
+    ]
+    assert trace[-1]["inputs"]["demand"] == 0
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "get_trace",
+            {"config_entry_id": "unknown"},
+            blocking=True,
+            return_response=True,
+        )
+
+
+async def test_profile(hass, setup_integration, tmp_path):
+    """Test that the profile service writes stats for the integration."""
+    hass.config.config_dir = str(tmp_path)
+
+    # Not tracked by hass, so block_till_done does not wait for the window
+    task = asyncio.ensure_future(
+        hass.services.async_call(
+            DOMAIN,
+            "profile",
+            {"duration": 5},
+            blocking=True,
+            return_response=True,
+        )
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.living_room_temp", "19.0")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+    response = await task
+
+    stats = pstats.Stats(response["stats_file"])
+    assert any("coordinator.py" in func[0] for func in stats.stats)
+    assert all("radiator_sync" in func[0] for func in stats.stats)
+    assert set(response["memory_bytes"]) == {
+        "coordinator",
+        "state_managers",
+        "entities",
+        "other",
+    }
+    assert (tmp_path / response["memory_file"]).exists()
+
+
+async def test_profile_stops_tracemalloc_on_failure(hass, setup_integration):
+    """Test that tracemalloc is stopped when cProfile cannot start."""
+    with (
+        patch("custom_components.radiator_sync.profiler.cProfile.Profile") as profile,
+        pytest.raises(HomeAssistantError),
+    ):
+        profile.return_value.enable.side_effect = ValueError(
+            "Another profiling tool is already active"
+        )
+        await hass.services.async_call(
+            DOMAIN, "profile", {"duration": 5}, blocking=True, return_response=True
+        )
+
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,67 @@
+"""Test the Radiator Sync latency timings."""
+
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+)
+
+from custom_components.radiator_sync.const import (
+    DOMAIN,
+    CONF_ADVANCED,
+    CONF_LATENCY_TIMINGS,
+)
+from custom_components.radiator_sync.timing import LatencyHistogram
+
+
+def test_histogram_percentiles():
+    """Test percentiles are bucket upper bounds capped by the maximum."""
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(0.001)
+    for _ in range(10):
+        histogram.record(0.1)
+
+    assert 0.001 <= histogram.percentile(50) < 0.0012
+    assert histogram.percentile(95) == 0.1
+    assert histogram.max == 0.1
+    assert histogram.count == 100
+
+
+async def test_timings_are_opt_in(hass, setup_integration):
+    """Test that nothing is instrumented unless timings are enabled."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]["coordinator"]
+    assert coordinator.timings is None
+    assert "_orchestrate" not in vars(coordinator)
+    assert hass.states.get("sensor.heater_latency_orchestration") is None
+
+
+async def test_timings_sensors(hass, setup_entry):
+    """Test that enabled timings are reported by the latency sensors."""
+    entry = await setup_entry(
+        "timings_entry_id",
+        states={"sensor.living_room_temp": "20.0"},
+        options={CONF_ADVANCED: {CONF_LATENCY_TIMINGS: True}},
+    )
+
+    hass.states.async_set("sensor.living_room_temp", "19.0")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    # Sensors follow the histograms once a minute
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=2))
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    assert coordinator.timings.histograms["temp_update"].count == 1
+    # Persisting is timed per store write, not per dirty mark
+    assert coordinator.persistence.save_count > 0
+    assert (
+        coordinator.timings.histograms["persist"].count
+        == coordinator.persistence.save_count
+    )
+    state = hass.states.get("sensor.heater_latency_orchestration")
+    assert state.attributes["count"] == 2
+    assert float(state.state) > 0
@@ -0,0 +1,74 @@
+"""Test the Radiator Sync event loop budget watchdog."""
+
+from datetime import timedelta
+from itertools import count
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+)
+
+from custom_components.radiator_sync.const import (
+    DOMAIN,
+    CONF_ADVANCED,
+    CONF_LOOP_BUDGET,
+    CONF_LOOP_BUDGET_STRICT,
+)
+from custom_components.radiator_sync.watchdog import LoopBudgetWatchdog
+
+
+def test_violations_are_logged_once_per_interval(caplog, freezer):
+    """Test that violations are counted but logged at most once per interval."""
+    watchdog = LoopBudgetWatchdog(0.05)
+    chain = watchdog.start()
+    chain.record("climate_control", "Bedroom", 0.2)
+    chain.record("climate_control", "Kitchen", 0.1)
+
+    watchdog.check(chain, 0.01)
+    for _ in range(3):
+        watchdog.check(chain, 0.2)
+    freezer.tick(timedelta(minutes=5))
+    watchdog.check(chain, 0.3)
+
+    assert watchdog.violations == 4
+    assert watchdog.worst == 0.3
+    assert (watchdog.last_stage, watchdog.last_room) == ("climate_control", "Bedroom")
+    warnings = [record.getMessage() for record in caplog.records]
+    assert len(warnings) == 2
+    assert "room: Bedroom" in warnings[0]
+    assert "2 earlier violations" in warnings[1]
+    assert not watchdog.degraded
+
+
+async def test_strict_mode_degrades_coalescing(hass, setup_entry):
+    """Test that a violation in strict mode stretches the coalescing window."""
+    entry = await setup_entry(
+        "watchdog_entry_id",
+        states={"sensor.living_room_temp": "20.0"},
+        options={CONF_ADVANCED: {CONF_LOOP_BUDGET: 5, CONF_LOOP_BUDGET_STRICT: True}},
+    )
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    assert coordinator.watchdog.violations == 0
+    assert coordinator.coalesce_window == 0.25
+
+    # Every clock reading is 10 ms after the previous one
+    clock = (step * 0.01 for step in count())
+    with patch(
+        "custom_components.radiator_sync.watchdog.perf_counter",
+        side_effect=lambda: next(clock),
+    ):
+        hass.states.async_set("sensor.living_room_temp", "19.0")
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    assert coordinator.watchdog.violations >= 1
+    assert coordinator.watchdog.degraded
+    assert coordinator.coalesce_window == 1.0
+
+    state = hass.states.get("sensor.heater_loop_budget_violations")
+    assert int(state.state) == coordinator.watchdog.violations
+    assert state.attributes["degraded"] is True
+    assert state.attributes["coalesce_window_ms"] == 1000